@@ -25,6 +25,13 @@ from utils.audit_logger import AuditLogger
 from core.session_manager import SessionManager
 from storage.storage_interface import StorageInterface, ImageRecord
 
+_UTC = timezone.utc
+
+
+def _now_iso() -> str:
+    """Current UTC time as an ISO-8601 string, for audit event payloads"""
+    return datetime.now(_UTC).isoformat()
+
 
 # Remove the duplicate ImageRecord definition since it's now imported
 # @dataclass
@@ -102,7 +109,7 @@ class GraphiVaultCore:
         try:
             # Audit the initialization attempt
             self.audit_logger.log_event('vault_init_attempt', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'vault_path': str(self.vault_path)
             })
             
@@ -127,14 +134,14 @@ class GraphiVaultCore:
             self._master_key_hash = hashlib.sha512(master_password.encode()).hexdigest()
             
             self.audit_logger.log_event('vault_init_success', {
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _now_iso()
             })
             
             return True
             
         except Exception as e:
             self.audit_logger.log_event('vault_init_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'error': str(e)
             })
             return False
@@ -147,7 +154,7 @@ class GraphiVaultCore:
         try:
             print("🔐 [CORE] Starting vault unlock process...")
             self.audit_logger.log_event('vault_unlock_attempt', {
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _now_iso()
             })
             
             # Verify vault exists
@@ -188,7 +195,7 @@ class GraphiVaultCore:
             
             print("🔐 [CORE] Vault unlocked successfully! ✅")
             self.audit_logger.log_event('vault_unlock_success', {
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _now_iso()
             })
             
             return True            
@@ -199,7 +206,7 @@ class GraphiVaultCore:
             print(f"🔐 [CORE] Traceback: {traceback.format_exc()}")
             
             self.audit_logger.log_event('vault_unlock_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'error': str(e)
             })
             return False
@@ -210,14 +217,15 @@ class GraphiVaultCore:
         """
         try:
             self.audit_logger.log_event('vault_lock', {
-                'timestamp': datetime.now(timezone.utc).isoformat()
+                'timestamp': _now_iso()
             })
             
             # Clear session data
             self.session_manager.destroy_session()
             
-            # Clear crypto keys from memory
+            # Clear crypto keys from memory, and the tags decrypted with them
             self.crypto.clear_keys()
+            self.tag_manager.clear_cache()
             
             # Reset state
             self._is_initialized = False
@@ -227,7 +235,7 @@ class GraphiVaultCore:
             
         except Exception as e:
             self.audit_logger.log_event('vault_lock_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'error': str(e)
             })
             return False
@@ -301,10 +309,11 @@ class GraphiVaultCore:
                 pass  # Thumbnail creation is optional
             
             # Prepare metadata
+            now = datetime.now(_UTC)
             full_metadata = {
                 'original_filename': file_path.name,
                 'file_extension': file_path.suffix,
-                'creation_time': datetime.now(timezone.utc).isoformat(),
+                'creation_time': now.isoformat(),
                 **(metadata or {})
             }
             
@@ -322,8 +331,8 @@ class GraphiVaultCore:
                 encrypted_size=encrypted_size,
                 mime_type=self.image_processor.get_mime_type(file_path),
                 file_hash=file_hash,
-                date_added=datetime.now(timezone.utc),
-                date_modified=datetime.now(timezone.utc),
+                date_added=now,
+                date_modified=now,
                 encrypted_tags=encrypted_tags,
                 encrypted_metadata=encrypted_metadata,
                 thumbnail_path=thumbnail_path
@@ -338,7 +347,7 @@ class GraphiVaultCore:
             print(f"✅ Core Engine: Image record stored successfully", file=sys.stderr)
             
             self.audit_logger.log_event('image_added', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'image_id': image_id,
                 'filename': file_path.name,
                 'size': original_size
@@ -352,7 +361,7 @@ class GraphiVaultCore:
             import traceback
             traceback.print_exc()
             self.audit_logger.log_event('image_add_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'error': str(e),
                 'filename': str(file_path) if 'file_path' in locals() else 'unknown'
             })
@@ -383,7 +392,7 @@ class GraphiVaultCore:
                 decrypted_data = self.crypto.decrypt_file_to_memory(str(encrypted_path))
                 
                 self.audit_logger.log_event('image_accessed', {
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'timestamp': _now_iso(),
                     'image_id': image_id
                 })
                 
@@ -395,7 +404,7 @@ class GraphiVaultCore:
                     
         except Exception as e:
             self.audit_logger.log_event('image_access_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'image_id': image_id,
                 'error': str(e)
             })
@@ -428,7 +437,7 @@ class GraphiVaultCore:
             self._delete_image_record(image_id)
             
             self.audit_logger.log_event('image_deleted', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'image_id': image_id
             })
             
@@ -436,7 +445,7 @@ class GraphiVaultCore:
             
         except Exception as e:
             self.audit_logger.log_event('image_delete_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'image_id': image_id,
                 'error': str(e)
             })
@@ -471,7 +480,7 @@ class GraphiVaultCore:
                     results.append(record)
             
             self.audit_logger.log_event('search_performed', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'query': query,
                 'results_count': len(results)
             })
@@ -480,7 +489,7 @@ class GraphiVaultCore:
             
         except Exception as e:
             self.audit_logger.log_event('search_error', {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': _now_iso(),
                 'query': query,
                 'error': str(e)
             })
@@ -8,6 +8,7 @@ Ensures proper vault organization and security policies
 import os
 import json
 import uuid
+import shutil
 from pathlib import Path
 from typing import Dict, Optional, Any
 from datetime import datetime, timezone
@@ -21,6 +22,38 @@ try:
 except ImportError:
     from crypto.crypto_controller import CryptoController
 
+# orjson writes UTF-8 bytes directly and parses bytes without a decode step;
+# the stdlib fallback produces the same layout
+try:
+    import orjson
+    
+    def _dump_json(data: Dict[str, Any], indent: bool = True) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(data)
+    
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_json(data: Dict[str, Any], indent: bool = True) -> bytes:
+        return json.dumps(data, indent=2 if indent else None).encode('utf-8')
+    
+    _load_json = json.loads
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """
+    Write data to path via a synced temp file and os.replace, so readers
+    never see a partially written file; the file is owner-only (0600)
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
 
 class VaultManager:
     """
@@ -85,8 +118,7 @@ class VaultManager:
             }
             
             # Write configuration
-            with open(self.vault_config_path, 'w') as f:
-                json.dump(vault_config, f, indent=2)
+            _atomic_write_bytes(self.vault_config_path, _dump_json(vault_config))
             logging.info("Vault configuration file created successfully.")
             
             # Create vault key file (encrypted master key storage)
@@ -105,22 +137,23 @@ class VaultManager:
     def vault_exists(self) -> bool:
         """Check if a valid vault exists at the specified path"""
         try:
-            # Check if vault directory exists
-            if not self.vault_path.exists():
-                return False
-            
-            # Check if configuration file exists
-            if not self.vault_config_path.exists():
-                return False
-            
-            # Check if key file exists
-            if not self.vault_key_path.exists():
+            # One directory read answers every existence check below; a
+            # missing vault directory raises and reports False
+            names = set()
+            dir_names = set()
+            with os.scandir(self.vault_path) as entries:
+                for entry in entries:
+                    names.add(entry.name)
+                    if entry.is_dir():
+                        dir_names.add(entry.name)
+            
+            # Check if configuration and key files exist
+            if self.vault_config_path.name not in names or self.vault_key_path.name not in names:
                 return False
             
             # Validate directory structure
-            for dir_path in self.directories.values():
-                if not dir_path.exists():
-                    return False
+            if not all(dir_path.name in dir_names for dir_path in self.directories.values()):
+                return False
             
             # Validate configuration file
             config = self.get_vault_config()
@@ -135,11 +168,7 @@ class VaultManager:
     def get_vault_config(self) -> Optional[Dict[str, Any]]:
         """Get vault configuration"""
         try:
-            if not self.vault_config_path.exists():
-                return None
-            
-            with open(self.vault_config_path, 'r') as f:
-                return json.load(f)
+            return _load_json(self.vault_config_path.read_bytes())
                 
         except Exception:
             return None
@@ -153,8 +182,7 @@ class VaultManager:
             existing_config['modified_at'] = datetime.now(timezone.utc).isoformat()
             
             # Write updated configuration
-            with open(self.vault_config_path, 'w') as f:
-                json.dump(existing_config, f, indent=2)
+            _atomic_write_bytes(self.vault_config_path, _dump_json(existing_config))
             
             return True
             
@@ -173,18 +201,24 @@ class VaultManager:
                 'vault_health': 'unknown'
             }
             
-            # Count files in data directory
+            # Count files in data directory; one directory read, and a stat
+            # only for the files being sized
             data_dir = self.directories['data']
             if data_dir.exists():
-                data_files = list(data_dir.glob('*.enc'))
-                stats['total_images'] = len(data_files)
-                stats['encrypted_size'] = sum(f.stat().st_size for f in data_files)
+                with os.scandir(data_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.enc') and entry.is_file():
+                            stats['total_images'] += 1
+                            stats['encrypted_size'] += entry.stat().st_size
             
             # Count thumbnails
             thumb_dir = self.directories['thumbnails']
             if thumb_dir.exists():
-                thumb_files = list(thumb_dir.glob('*_thumb.jpg'))
-                stats['thumbnails_count'] = len(thumb_files)
+                with os.scandir(thumb_dir) as entries:
+                    stats['thumbnails_count'] = sum(
+                        1 for entry in entries
+                        if entry.name.endswith('_thumb.jpg') and entry.is_file()
+                    )
             
             # Vault health check
             stats['vault_health'] = self._check_vault_health()
@@ -230,8 +264,7 @@ class VaultManager:
             
             # Save backup metadata
             backup_metadata_path = backup_path / 'backup_metadata.json'
-            with open(backup_metadata_path, 'w') as f:
-                json.dump(backup_metadata, f, indent=2)
+            _atomic_write_bytes(backup_metadata_path, _dump_json(backup_metadata))
             
             return True
             
@@ -292,8 +325,7 @@ class VaultManager:
                 'iterations': 200000
             }
             
-            with open(self.vault_key_path, 'w') as f:
-                json.dump(key_data, f)
+            _atomic_write_bytes(self.vault_key_path, _dump_json(key_data, indent=False))
             
             return True
             
@@ -330,19 +362,21 @@ class VaultManager:
             # Check data directory for unknown .enc files
             data_dir = self.directories['data']
             if data_dir.exists():
-                for file_path in data_dir.iterdir():
-                    if file_path.is_file() and file_path.suffix == '.enc':
-                        # Check if this file is referenced in database
-                        # This would require database integration
-                        pass
+                with os.scandir(data_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('.enc') and entry.is_file():
+                            # Check if this file is referenced in database
+                            # This would require database integration
+                            pass
             
             # Check thumbnails directory for orphaned thumbnails
             thumb_dir = self.directories['thumbnails']
             if thumb_dir.exists():
-                for file_path in thumb_dir.iterdir():
-                    if file_path.is_file() and file_path.name.endswith('_thumb.jpg'):
-                        # Check if corresponding image exists
-                        pass
+                with os.scandir(thumb_dir) as entries:
+                    for entry in entries:
+                        if entry.name.endswith('_thumb.jpg') and entry.is_file():
+                            # Check if corresponding image exists
+                            pass
             
         except Exception:
             pass
@@ -351,21 +385,6 @@ class VaultManager:
     
     def _cleanup_vault(self) -> None:
         """Clean up vault directory on creation failure"""
-        try:
-            if self.vault_path.exists():
-                # Remove all created files and directories
-                for item in self.vault_path.rglob('*'):
-                    if item.is_file():
-                        item.unlink()
-                
-                # Remove directories (bottom-up)
-                for item in sorted(self.vault_path.rglob('*'), reverse=True):
-                    if item.is_dir():
-                        item.rmdir()
-                
-                # Remove vault root if empty
-                if not any(self.vault_path.iterdir()):
-                    self.vault_path.rmdir()
-                    
-        except Exception:
-            pass  # Best effort cleanup
+        # Remove the vault root and everything created under it in one
+        # bottom-up walk; best effort, errors are ignored
+        shutil.rmtree(self.vault_path, ignore_errors=True)
@@ -14,6 +14,7 @@ from pathlib import Path
 import json
 
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
@@ -53,6 +54,9 @@ class CryptoController:
         self._master_key = None
         self._session_key = None
         self._tag_keychain = None
+        # AES-GCM contexts keyed by raw key, so the key schedule is built
+        # once per key rather than once per record
+        self._aead_cache: Dict[bytes, AESGCM] = {}
         self._key_derivation_salt = None
         
     def save_crypto_params(self, vault_path: Path) -> bool:
@@ -84,13 +88,9 @@ class CryptoController:
     def load_crypto_params(self, vault_path: Path) -> bool:
         """Load cryptographic parameters from vault key file"""
         try:
+            # A missing key file lands in the except below
             key_file = vault_path / 'vault.key'
-            
-            if not key_file.exists():
-                return False
-            
-            with open(key_file, 'r') as f:
-                crypto_params = json.load(f)
+            crypto_params = json.loads(key_file.read_bytes())
             
             # Update config with loaded parameters
             self.config.update({
@@ -316,6 +316,51 @@ class CryptoController:
         except Exception as e:
             raise RuntimeError(f"Decryption failed: {e}")
     
+    def _get_aead(self, key: bytes) -> AESGCM:
+        """Return the cached AES-GCM context for key"""
+        aead = self._aead_cache.get(key)
+        if aead is None:
+            aead = AESGCM(key)
+            self._aead_cache[key] = aead
+        return aead
+    
+    def _aead_encrypt(self, key: bytes, data: bytes) -> bytes:
+        """
+        AES-GCM encrypt data under key
+        Returns: nonce + tag + encrypted_data
+        """
+        nonce_size = self.config['nonce_size']
+        tag_size = self.config['tag_size']
+        nonce = secrets.token_bytes(nonce_size)
+        
+        if tag_size != 16:
+            # AESGCM only emits full-length tags
+            encryptor = Cipher(algorithms.AES(key), modes.GCM(nonce), backend=default_backend()).encryptor()
+            encrypted_data = encryptor.update(data)
+            encryptor.finalize()
+            return nonce + encryptor.tag[:tag_size] + encrypted_data
+        
+        sealed = self._get_aead(key).encrypt(nonce, data, None)
+        return nonce + sealed[-tag_size:] + sealed[:-tag_size]
+    
+    def _aead_decrypt(self, key: bytes, encrypted_data: bytes) -> bytes:
+        """AES-GCM decrypt a nonce + tag + encrypted_data blob under key"""
+        nonce_size = self.config['nonce_size']
+        tag_size = self.config['tag_size']
+        nonce = encrypted_data[:nonce_size]
+        tag = encrypted_data[nonce_size:nonce_size + tag_size]
+        ciphertext = encrypted_data[nonce_size + tag_size:]
+        
+        if tag_size != 16:
+            decryptor = Cipher(
+                algorithms.AES(key), modes.GCM(nonce, tag, min_tag_length=tag_size), backend=default_backend()
+            ).decryptor()
+            decrypted_data = decryptor.update(ciphertext)
+            decryptor.finalize()
+            return decrypted_data
+        
+        return self._get_aead(key).decrypt(nonce, ciphertext + tag, None)
+    
     def encrypt_data(self, data: bytes) -> bytes:
         """
         Encrypt arbitrary data using session key
@@ -325,20 +370,7 @@ class CryptoController:
             raise RuntimeError("Session key not initialized")
         
         try:
-            nonce = secrets.token_bytes(self.config['nonce_size'])
-            
-            cipher = Cipher(
-                algorithms.AES(self._session_key),
-                modes.GCM(nonce),
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
-            
-            encrypted_data = encryptor.update(data)
-            encryptor.finalize()
-            
-            # Return nonce + tag + encrypted_data
-            return nonce + encryptor.tag + encrypted_data
+            return self._aead_encrypt(self._session_key, data)
             
         except Exception as e:
             raise RuntimeError(f"Data encryption failed: {e}")
@@ -351,22 +383,7 @@ class CryptoController:
             raise RuntimeError("Session key not initialized")
         
         try:
-            # Extract components
-            nonce = encrypted_data[:self.config['nonce_size']]
-            tag = encrypted_data[self.config['nonce_size']:self.config['nonce_size'] + self.config['tag_size']]
-            ciphertext = encrypted_data[self.config['nonce_size'] + self.config['tag_size']:]
-            
-            cipher = Cipher(
-                algorithms.AES(self._session_key),
-                modes.GCM(nonce, tag),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            
-            decrypted_data = decryptor.update(ciphertext)
-            decryptor.finalize()
-            
-            return decrypted_data
+            return self._aead_decrypt(self._session_key, encrypted_data)
             
         except Exception as e:
             raise RuntimeError(f"Data decryption failed: {e}")
@@ -379,19 +396,7 @@ class CryptoController:
             raise RuntimeError("Tag keychain not initialized")
         
         try:
-            nonce = secrets.token_bytes(self.config['nonce_size'])
-            
-            cipher = Cipher(
-                algorithms.AES(self._tag_keychain),
-                modes.GCM(nonce),
-                backend=default_backend()
-            )
-            encryptor = cipher.encryptor()
-            
-            encrypted_data = encryptor.update(data)
-            encryptor.finalize()
-            
-            return nonce + encryptor.tag + encrypted_data
+            return self._aead_encrypt(self._tag_keychain, data)
             
         except Exception as e:
             raise RuntimeError(f"Tag encryption failed: {e}")
@@ -404,22 +409,7 @@ class CryptoController:
             raise RuntimeError("Tag keychain not initialized")
         
         try:
-            # Extract components
-            nonce = encrypted_data[:self.config['nonce_size']]
-            tag = encrypted_data[self.config['nonce_size']:self.config['nonce_size'] + self.config['tag_size']]
-            ciphertext = encrypted_data[self.config['nonce_size'] + self.config['tag_size']:]
-            
-            cipher = Cipher(
-                algorithms.AES(self._tag_keychain),
-                modes.GCM(nonce, tag),
-                backend=default_backend()
-            )
-            decryptor = cipher.decryptor()
-            
-            decrypted_data = decryptor.update(ciphertext)
-            decryptor.finalize()
-            
-            return decrypted_data
+            return self._aead_decrypt(self._tag_keychain, encrypted_data)
             
         except Exception as e:
             raise RuntimeError(f"Tag decryption failed: {e}")
@@ -456,6 +446,8 @@ class CryptoController:
         """
         Securely clear all cryptographic keys from memory
         """
+        self._aead_cache.clear()
+        
         if self._master_key:
             # Overwrite with random data before clearing
             self._master_key = secrets.token_bytes(len(self._master_key))
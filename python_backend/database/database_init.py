@@ -125,7 +125,7 @@ class DatabaseInitializer:
             
             # Clean up test data
             storage._get_connection().execute("DELETE FROM vault_meta WHERE key = ?", (test_key,))
-            storage._get_connection().commit()
+            storage.invalidate_settings_cache()
             
             return True
             
@@ -25,6 +25,9 @@ class SearchEngine:
     - Search result ranking and relevance scoring
     """
     
+    # Distinct queries kept parsed in search_cache
+    SEARCH_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize search engine"""
         self.search_cache = {}
@@ -48,14 +51,31 @@ class SearchEngine:
             if not query or not query.strip():
                 return True
             
-            # Parse and execute query
-            parsed_query = self._parse_query(query)
+            # Parse (or reuse) and execute query
+            parsed_query = self.compile_query(query)
             return self._evaluate_query(parsed_query, filename, tags, metadata)
             
         except Exception:
             # Fallback to simple string matching
             return self._simple_search(query, filename, tags, metadata)
     
+    def compile_query(self, query: str) -> Dict[str, Any]:
+        """
+        Parse a query once and precompile its wildcard patterns.
+        Results are memoized in search_cache, so search_and_rank parses the
+        query once per search rather than once per record.
+        """
+        parsed = self.search_cache.get(query)
+        if parsed is None:
+            parsed = self._parse_query(query)
+            parsed['wildcard_patterns'] = [
+                self._compile_wildcard(wildcard) for wildcard in parsed['wildcards']
+            ]
+            if len(self.search_cache) >= self.SEARCH_CACHE_SIZE:
+                self.search_cache.clear()
+            self.search_cache[query] = parsed
+        return parsed
+    
     def search_and_rank(self, query: str, image_records: List[Dict], 
                        tag_filters: List[str] = None, 
                        date_range: Tuple[datetime, datetime] = None) -> List[Tuple[Dict, float]]:
@@ -262,19 +282,27 @@ class SearchEngine:
             
             # Check phrases
             searchable_text = self._build_searchable_text(filename, tags, metadata)
+            searchable_lower = searchable_text.lower()
             for phrase in parsed_query['phrases']:
-                if phrase.lower() not in searchable_text.lower():
+                if phrase.lower() not in searchable_lower:
                     return False
             
             # Check terms (AND logic by default)
             for term in parsed_query['terms']:
-                if term.lower() not in searchable_text.lower():
+                if term not in searchable_lower:
                     return False
             
-            # Check wildcards
-            for wildcard in parsed_query['wildcards']:
-                if not self._wildcard_match(wildcard, searchable_text):
-                    return False
+            # Check wildcards, using compiled patterns when available
+            patterns = parsed_query.get('wildcard_patterns')
+            if patterns is not None:
+                for pattern in patterns:
+                    # None marks a term that is not a valid pattern: no match
+                    if pattern is None or not pattern.search(searchable_text):
+                        return False
+            else:
+                for wildcard in parsed_query['wildcards']:
+                    if not self._wildcard_match(wildcard, searchable_text):
+                        return False
             
             return True
             
@@ -463,6 +491,17 @@ class SearchEngine:
         except Exception:
             return False
     
+    def _compile_wildcard(self, pattern: str) -> Optional[re.Pattern]:
+        """
+        Compile a wildcard pattern as _wildcard_match would; None if the
+        result is not a valid regex, which matches nothing
+        """
+        try:
+            return re.compile(pattern.replace('*', '.*').replace('?', '.'), re.IGNORECASE)
+            
+        except re.error:
+            return None
+    
     def _wildcard_match(self, pattern: str, text: str) -> bool:
         """
         Check wildcard pattern match
@@ -5,17 +5,35 @@ Secure bridge between Tauri frontend and Python backend
 Exposes select methods through command-line interface for Tauri integration
 """
 
+import os
 import sys
 import json
 import argparse
+import base64
+import binascii
+import hashlib
+import tempfile
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import traceback
 
+# Prefer the SIMD-accelerated base64 codec when available
+try:
+    import pybase64 as _b64
+except ImportError:
+    _b64 = base64
+
 from core.core_engine import GraphiVaultCore
 from storage.storage_interface import StorageInterface
 
 
+def _debug_traceback() -> Dict[str, str]:
+    """Traceback field for error responses, only when GRAPHIVAULT_DEBUG is set"""
+    if os.environ.get('GRAPHIVAULT_DEBUG'):
+        return {'traceback': traceback.format_exc()}
+    return {}
+
+
 class IPCGateway:
     """
     IPC Gateway - The secure bridge to the frontend
@@ -31,8 +49,30 @@ class IPCGateway:
     def __init__(self, vault_path: str):
         """Initialize IPC Gateway"""
         self.vault_path = Path(vault_path)
+        # Plain-string form for os.path joins on hot paths
+        self._vault_str = os.fspath(self.vault_path)
         self.core = None
         self.storage = None
+    
+    def _db_path(self) -> str:
+        """Path of the vault database"""
+        return os.path.join(self._vault_str, 'database', 'vault.db')
+    
+    def _open_storage(self, db_path: str) -> StorageInterface:
+        """
+        Open this gateway's storage handle for the current session; the
+        handle stays open for every command until lock_vault
+        """
+        # A re-initialize or re-unlock brings a new crypto controller, so
+        # any handle bound to the previous one is closed rather than rebound
+        self._release_storage()
+        return StorageInterface(db_path, self.core.crypto)
+    
+    def _release_storage(self) -> None:
+        """Close and forget this gateway's storage handle"""
+        if self.storage is not None:
+            self.storage.close()
+            self.storage = None
         
     def initialize_vault(self, master_password: str, config: Dict[str, Any] = None) -> Dict[str, Any]:
         """Initialize vault with master password"""
@@ -41,8 +81,7 @@ class IPCGateway:
             
             if self.core.initialize_vault(master_password):
                 # Initialize storage interface
-                db_path = self.vault_path / 'database' / 'vault.db'
-                self.storage = StorageInterface(str(db_path), self.core.crypto)
+                self.storage = self._open_storage(self._db_path())
                 
                 return {
                     'success': True,
@@ -65,18 +104,17 @@ class IPCGateway:
         try:
             self.core = GraphiVaultCore(str(self.vault_path), config)
             # Check if vault directory and files exist
-            vault_config = self.vault_path / 'vault.config'
-            vault_key = self.vault_path / 'vault.key'
-            db_path = self.vault_path / 'database' / 'vault.db'
-            missing = []
-            if not self.vault_path.exists():
-                missing.append(str(self.vault_path))
-            if not vault_config.exists():
-                missing.append(str(vault_config))
-            if not vault_key.exists():
-                missing.append(str(vault_key))
-            if not db_path.exists():
-                missing.append(str(db_path))
+            join = os.path.join
+            db_path = self._db_path()
+            missing = [
+                p for p in (
+                    self._vault_str,
+                    join(self._vault_str, 'vault.config'),
+                    join(self._vault_str, 'vault.key'),
+                    db_path,
+                )
+                if not os.path.exists(p)
+            ]
             if missing:
                 return {
                     'success': False,
@@ -88,7 +126,7 @@ class IPCGateway:
             # Try to unlock
             unlock_result = self.core.unlock_vault(master_password)
             if unlock_result is True:
-                self.storage = StorageInterface(str(db_path), self.core.crypto)
+                self.storage = self._open_storage(db_path)
                 return {
                     'success': True,
                     'message': 'Vault unlocked successfully'
@@ -119,7 +157,7 @@ class IPCGateway:
             return {
                 'success': False,
                 'error': f'Unlock error: {str(e)}',
-                'traceback': traceback.format_exc()
+                **_debug_traceback()
             }
     
     def lock_vault(self) -> Dict[str, Any]:
@@ -134,9 +172,9 @@ class IPCGateway:
             
             # Try to lock the vault
             if self.core.lock_vault():
-                # Clear the core and storage references
+                # Close the storage handle and clear references
+                self._release_storage()
                 self.core = None
-                self.storage = None
                 return {
                     'success': True,
                     'message': 'Vault locked successfully'
@@ -157,14 +195,14 @@ class IPCGateway:
         """Get vault status and information"""
         try:
             # Check if vault exists without initializing core
-            vault_path = Path(str(self.vault_path))
+            join = os.path.join
             
             # Basic directory structure check
             vault_exists = (
-                vault_path.exists() and
-                (vault_path / 'vault.config').exists() and
-                (vault_path / 'vault.key').exists() and
-                (vault_path / 'database').exists()
+                os.path.exists(self._vault_str) and
+                os.path.exists(join(self._vault_str, 'vault.config')) and
+                os.path.exists(join(self._vault_str, 'vault.key')) and
+                os.path.exists(join(self._vault_str, 'database'))
             )
             
             if not vault_exists:
@@ -206,9 +244,6 @@ class IPCGateway:
             if not self.core._is_initialized:
                 return {'success': False, 'error': 'Vault not unlocked'}
             
-            import base64
-            import tempfile
-            
             # Log received parameters
             print(f"Received add_image call with tags: {tags}, type: {type(tags)}", file=sys.stderr)
             
@@ -233,9 +268,9 @@ class IPCGateway:
             
             # Decode the base64 string
             try:
-                image_data = base64.b64decode(file_contents)
+                image_data = _b64.b64decode(file_contents)
                 print(f"Successfully decoded base64 data: {len(image_data)} bytes", file=sys.stderr)
-            except (base64.binascii.Error, TypeError) as e:
+            except (binascii.Error, TypeError) as e:
                 return {'success': False, 'error': f'Invalid base64 data: {e}'}
 
             # Determine file extension from image data
@@ -281,7 +316,6 @@ class IPCGateway:
                 
         except Exception as e:
             print(f"Exception in add_image: {e}", file=sys.stderr)
-            import traceback
             traceback.print_exc()
             return {
                 'success': False,
@@ -321,8 +355,7 @@ class IPCGateway:
                 image_data = self.core.get_image(image_id, decrypt=True)
                 if image_data:
                     # Return base64 encoded data for transport
-                    import base64
-                    encoded_data = base64.b64encode(image_data).decode('ascii')
+                    encoded_data = _b64.b64encode(image_data).decode('ascii')
                     return {
                         'success': True,
                         'image_data': encoded_data
@@ -357,27 +390,93 @@ class IPCGateway:
                 'error': f'Get image error: {str(e)}'
             }
     
+    @staticmethod
+    def _thumbnail_cache_prefix(image_id: str) -> str:
+        """Filesystem-safe prefix shared by all cached thumbnails of an image"""
+        return hashlib.sha256(image_id.encode()).hexdigest()[:32]
+    
+    def get_thumbnail(self, image_id: str, width: int, height: int) -> Dict[str, Any]:
+        """Get a WebP thumbnail sized for the requesting view"""
+        try:
+            if not self.core or not self.storage:
+                return {'success': False, 'error': 'Vault not initialized'}
+            
+            width, height = int(width), int(height)
+            if width <= 0 or height <= 0:
+                return {'success': False, 'error': 'Thumbnail size must be positive'}
+            
+            # Never serve a cached thumbnail of a deleted image
+            if self.storage.get_image(image_id) is None:
+                return {'success': False, 'error': 'Image not found'}
+            
+            # Rendered thumbnails are cached encrypted, one file per size
+            thumb_dir = os.path.join(self._vault_str, 'thumbnails')
+            cache_path = os.path.join(
+                thumb_dir, f'{self._thumbnail_cache_prefix(image_id)}_{width}x{height}.webp.enc'
+            )
+            
+            thumbnail_data = None
+            try:
+                with open(cache_path, 'rb') as f:
+                    thumbnail_data = self.core.crypto.decrypt_data(f.read())
+            except FileNotFoundError:
+                pass
+            except RuntimeError:
+                # Stale entry from another key; regenerate below
+                thumbnail_data = None
+            
+            if thumbnail_data is None:
+                image_data = self.core.get_image(image_id, decrypt=True)
+                if not image_data:
+                    return {'success': False, 'error': 'Image not found'}
+                
+                thumbnail_data = self.core.image_processor.render_thumbnail(
+                    image_data, (width, height)
+                )
+                os.makedirs(thumb_dir, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    f.write(self.core.crypto.encrypt_data(thumbnail_data))
+            
+            return {
+                'success': True,
+                'thumbnail_data': _b64.b64encode(thumbnail_data).decode('ascii'),
+                'mime_type': 'image/webp'
+            }
+            
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Get thumbnail error: {str(e)}'
+            }
+    
     def get_all_images(self, limit: int = None, offset: int = 0) -> Dict[str, Any]:
         """Get all images from vault"""
         try:
             if not self.storage:
                 return {'success': False, 'error': 'Storage not initialized'}
             
-            image_records = self.storage.get_all_images(limit, offset)
+            image_records = self.storage.iter_all_images(limit, offset)
             
             images = []
+            undecryptable = 0
+            # Hoist bound methods out of the per-record loop
+            decrypt_tags = self.core.tag_manager.decrypt_tags
+            decrypt = self.core.crypto.decrypt_data
+            loads = json.loads
+            append = images.append
             for record in image_records:
-                # Decrypt tags and metadata for display
+                # Decrypt tags and metadata for display. The crypto layer
+                # wraps cipher failures in RuntimeError; decode/JSON errors
+                # are ValueError subclasses. Anything else is a real bug.
                 try:
-                    decrypted_tags = self.core.tag_manager.decrypt_tags(record.encrypted_tags)
-                    decrypted_metadata = json.loads(
-                        self.core.crypto.decrypt_data(record.encrypted_metadata).decode()
-                    )
-                except Exception:
+                    decrypted_tags = decrypt_tags(record.encrypted_tags)
+                    decrypted_metadata = loads(decrypt(record.encrypted_metadata).decode())
+                except (RuntimeError, ValueError):
+                    undecryptable += 1
                     decrypted_tags = []
                     decrypted_metadata = {}
                 
-                images.append({
+                append({
                     'id': record.id,
                     'name': record.name,
                     'size': record.original_size,
@@ -390,6 +489,9 @@ class IPCGateway:
                     'is_encrypted': record.is_encrypted
                 })
             
+            if undecryptable:
+                print(f"get_all_images: {undecryptable} record(s) could not be decrypted", file=sys.stderr)
+            
             return {
                 'success': True,
                 'images': images,
@@ -426,19 +528,22 @@ class IPCGateway:
                     print(f"Could not convert tag_filters to list: {e}", file=sys.stderr)
                     tag_filters = []
             
-            # Get all images for searching (in a real implementation, this would be optimized)
-            all_records = self.storage.get_all_images()
+            # Stream records for searching rather than materializing the table
+            all_records = self.storage.iter_all_images()
             
             # Convert to searchable format
             searchable_records = []
+            undecryptable = 0
+            decrypt_tags = self.core.tag_manager.decrypt_tags
+            decrypt = self.core.crypto.decrypt_data
+            loads = json.loads
+            append = searchable_records.append
             for record in all_records:
                 try:
-                    decrypted_tags = self.core.tag_manager.decrypt_tags(record.encrypted_tags)
-                    decrypted_metadata = json.loads(
-                        self.core.crypto.decrypt_data(record.encrypted_metadata).decode()
-                    )
+                    decrypted_tags = decrypt_tags(record.encrypted_tags)
+                    decrypted_metadata = loads(decrypt(record.encrypted_metadata).decode())
                     
-                    searchable_records.append({
+                    append({
                         'id': record.id,
                         'name': record.name,
                         'tags': decrypted_tags,
@@ -447,9 +552,13 @@ class IPCGateway:
                         'mimeType': record.mime_type,
                         'dateAdded': record.date_added.isoformat()
                     })
-                except Exception:
+                except (RuntimeError, ValueError):
+                    undecryptable += 1
                     continue
             
+            if undecryptable:
+                print(f"search_images: skipped {undecryptable} undecryptable record(s)", file=sys.stderr)
+            
             # Perform search
             results = self.core.search_engine.search_and_rank(
                 query, searchable_records, tag_filters
@@ -489,8 +598,13 @@ class IPCGateway:
             
             # Delete from core engine (handles file deletion)
             if self.core.delete_image(image_id):
-                # Delete from database
-                if self.storage.delete_image(image_id):
+                # Drop any sized thumbnails rendered for this image
+                prefix = self._thumbnail_cache_prefix(image_id)
+                for cached in (self.vault_path / 'thumbnails').glob(f'{prefix}_*.webp.enc'):
+                    cached.unlink(missing_ok=True)
+                
+                # Delete from database; core normally removed the row already
+                if self.storage.delete_image(image_id) or self.storage.get_image(image_id) is None:
                     return {
                         'success': True,
                         'message': 'Image deleted successfully'
@@ -601,14 +715,14 @@ class IPCGateway:
     def vault_exists(self) -> Dict[str, Any]:
         """Check if the vault exists at the specified path."""
         try:
-            vault_path = Path(self.vault_path)
+            join = os.path.join
             
             # Check for essential vault components
-            config_exists = (vault_path / 'vault.config').exists()
-            key_exists = (vault_path / 'vault.key').exists()
-            db_dir_exists = (vault_path / 'database').exists()
+            config_exists = os.path.exists(join(self._vault_str, 'vault.config'))
+            key_exists = os.path.exists(join(self._vault_str, 'vault.key'))
+            db_dir_exists = os.path.exists(join(self._vault_str, 'database'))
 
-            exists = vault_path.is_dir() and config_exists and key_exists and db_dir_exists
+            exists = os.path.isdir(self._vault_str) and config_exists and key_exists and db_dir_exists
             
             return {
                 'success': True,
@@ -620,7 +734,7 @@ class IPCGateway:
             return {
                 'success': False,
                 'error': f'Error checking vault existence: {str(e)}',
-                'traceback': traceback.format_exc()
+                **_debug_traceback()
             }
 
 
@@ -703,6 +817,14 @@ def main():
             else:
                 result = gateway.get_image(image_id, decrypt)
         
+        elif command == 'get_thumbnail':
+            if not image_id:
+                result = {'success': False, 'error': 'Image ID required'}
+            else:
+                result = gateway.get_thumbnail(
+                    image_id, payload.get('width', 256), payload.get('height', 256)
+                )
+        
         elif command == 'get_all_images':
             result = gateway.get_all_images(limit, offset)
         
@@ -737,7 +859,7 @@ def main():
         error_result = {
             'success': False,
             'error': f'Gateway error: {str(e)}',
-            'traceback': traceback.format_exc()
+            **_debug_traceback()
         }
         print(json.dumps(error_result, indent=2, ensure_ascii=False))
         sys.exit(1)
@@ -5,22 +5,84 @@ SQLite-backed storage abstraction with prepared queries and schema control
 Provides secure, ACID-compliant data persistence for the vault system
 """
 
+import os
+import queue
 import sqlite3
 import json
 import threading
 import secrets
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
+import time
 import uuid
+import weakref
 import logging
 
+# orjson encodes straight to UTF-8 bytes and is several times faster than
+# the stdlib codec; both read back the same BLOBs
+try:
+    import orjson
+    
+    def _dump_event(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data)
+    
+    _load_event = orjson.loads
+    _EVENT_DECODE_ERRORS: Tuple[type, ...] = (orjson.JSONDecodeError,)
+except ImportError:
+    def _dump_event(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    
+    _load_event = json.loads
+    _EVENT_DECODE_ERRORS = (ValueError,)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Timestamps are stored as INTEGER microseconds since the Unix epoch (UTC)
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+_fromiso = datetime.fromisoformat
+
+
+def _now_us() -> int:
+    """Current UTC time in epoch microseconds"""
+    return time.time_ns() // 1000
+
+
+def _to_us(dt: datetime) -> int:
+    """Convert a datetime to epoch microseconds (naive values are local time)"""
+    if dt.tzinfo is None:
+        dt = dt.astimezone()
+    return (dt - _EPOCH) // _ONE_US
+
+
+def _as_us(value: Any) -> int:
+    """Normalize a datetime, ISO-8601 string or epoch-microsecond value"""
+    if isinstance(value, datetime):
+        return _to_us(value)
+    if isinstance(value, str):
+        return _to_us(_fromiso(value))
+    return int(value)
+
+
+def _from_db_time(value: Any) -> datetime:
+    """Convert a stored timestamp to an aware UTC datetime.
+    Accepts epoch microseconds and, for rows written before the switch to
+    INTEGER columns, ISO-8601 text.
+    """
+    if isinstance(value, str):
+        if not value.isdigit():
+            return _fromiso(value)
+        value = int(value)
+    # timedelta * int skips the keyword-argument constructor (~2x faster)
+    return _EPOCH + _ONE_US * value
+
+
 # GraphiVault Database Models
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ImageRecord:
     """Secure image record with encrypted metadata"""
     id: str
@@ -37,7 +99,7 @@ class ImageRecord:
     thumbnail_path: Optional[str] = None
     is_encrypted: bool = True
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TagRecord:
     """Encrypted tag record"""
     id: int
@@ -46,7 +108,7 @@ class TagRecord:
     tag_type: Optional[str] = None
     created_at: Optional[datetime] = None
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AnnotationRecord:
     """Encrypted annotation record"""
     id: int
@@ -54,12 +116,257 @@ class AnnotationRecord:
     note: str  # Encrypted content
     created_at: Optional[datetime] = None
 
+@dataclass(slots=True, frozen=True)
+class ImageSummary:
+    """Gallery listing row without the encrypted payload columns"""
+    id: str
+    name: str
+    mime_type: str
+    original_size: int
+    thumbnail_path: Optional[str]
+    date_added: datetime
+
+@dataclass
+class SqliteConfig:
+    """SQLite tuning applied to every StorageInterface connection"""
+    synchronous: str = 'NORMAL'
+    cache_size_kib: int = 65536          # 64MB page cache per connection
+    mmap_size: int = 2 * 1024 ** 3       # 2GB memory-mapped read window
+    wal_autocheckpoint: int = 10000      # pages between automatic checkpoints
+    busy_timeout_ms: int = 5000
+    temp_store: str = 'MEMORY'
+    page_size: int = 4096                # only takes effect on a new database
+    secure_delete: bool = True
+    
+    @classmethod
+    def fast(cls) -> 'SqliteConfig':
+        """Throughput-oriented profile (the default)"""
+        return cls()
+    
+    @classmethod
+    def safe(cls) -> 'SqliteConfig':
+        """Durability-oriented profile: fsync every commit, no mmap"""
+        return cls(synchronous='FULL', mmap_size=0, wal_autocheckpoint=1000)
+    
+    def pragmas(self, read_only: bool = False) -> Tuple[str, ...]:
+        """PRAGMA statements for a writer or read-only connection, in order"""
+        statements = []
+        if not read_only:
+            # page_size and auto_vacuum must be set before the first table
+            # exists and before switching to WAL; on an existing database
+            # they are no-ops
+            statements += [
+                f"PRAGMA page_size = {int(self.page_size)}",
+                "PRAGMA auto_vacuum = INCREMENTAL",
+                "PRAGMA journal_mode = WAL",
+                f"PRAGMA wal_autocheckpoint = {int(self.wal_autocheckpoint)}",
+                f"PRAGMA secure_delete = {'ON' if self.secure_delete else 'OFF'}",
+            ]
+        statements += [
+            "PRAGMA foreign_keys = ON",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA busy_timeout = {int(self.busy_timeout_ms)}",
+            f"PRAGMA cache_size = -{int(self.cache_size_kib)}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            f"PRAGMA mmap_size = {int(self.mmap_size)}",
+        ]
+        return tuple(statements)
+
 # Import crypto controller
 try:
     from ..crypto.crypto_controller import CryptoController
 except ImportError:
     from crypto.crypto_controller import CryptoController
 
+# Hot-path SQL templates. Each is executed through a cursor cached per
+# connection (see StorageInterface._exec) so the compiled statement is reused.
+SQL_INSERT_IMAGE = """
+    INSERT INTO images (
+        id, name, encrypted_path, original_size, encrypted_size,
+        mime_type, file_hash, date_added, date_modified,
+        thumbnail_path, is_encrypted
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+SQL_INSERT_IMAGE_PAYLOAD = """
+    INSERT INTO image_payload (image_id, encrypted_tags, encrypted_metadata)
+    VALUES (?, ?, ?)
+"""
+SQL_INSERT_TAG = """
+    INSERT INTO tags (image_id, tag_name, tag_type, created_at)
+    VALUES (?, ?, ?, ?)
+"""
+SQL_INSERT_ANNOTATION = """
+    INSERT INTO annotations (image_id, note, created_at)
+    VALUES (?, ?, ?)
+"""
+SQL_INSERT_AUTH_LOG = """
+    INSERT INTO auth_logs (event_type, timestamp, status, details)
+    VALUES (?, ?, ?, ?)
+"""
+# Native UPSERT (SQLite 3.24+) updates the row in place; older libraries
+# fall back to INSERT OR REPLACE, which deletes and re-inserts it
+if sqlite3.sqlite_version_info >= (3, 24, 0):
+    SQL_UPSERT_VAULT_META = """
+        INSERT INTO vault_meta (key, value, last_updated)
+        VALUES (?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            last_updated = excluded.last_updated
+    """
+    SQL_UPSERT_VAULT_SETTING = """
+        INSERT INTO vault_settings (key, value, encrypted, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            encrypted = excluded.encrypted,
+            updated_at = excluded.updated_at
+    """
+else:
+    SQL_UPSERT_VAULT_META = """
+        INSERT OR REPLACE INTO vault_meta (key, value, last_updated)
+        VALUES (?, ?, ?)
+    """
+    SQL_UPSERT_VAULT_SETTING = """
+        INSERT OR REPLACE INTO vault_settings (key, value, encrypted, created_at, updated_at)
+        VALUES (?, ?, ?, ?, ?)
+    """
+SQL_INSERT_AUDIT_LOG = """
+    INSERT INTO audit_log (timestamp, event_type, event_data, session_hash)
+    VALUES (?, ?, ?, ?)
+"""
+SQL_SELECT_VAULT_META = "SELECT value FROM vault_meta WHERE key = ?"
+SQL_DELETE_IMAGE = "DELETE FROM images WHERE id = ?"
+SQL_SELECT_SCHEMA_VERSION = "SELECT MAX(version) FROM schema_version"
+SQL_INSERT_SCHEMA_VERSION = """
+    INSERT INTO schema_version (version, applied_at, description)
+    VALUES (?, ?, ?)
+"""
+SQL_SELECT_IMAGE_TAGS = """
+    SELECT id, image_id, tag_name, tag_type, created_at
+    FROM tags
+    WHERE image_id = ?
+    ORDER BY created_at
+"""
+SQL_SELECT_IMAGE_ANNOTATIONS = """
+    SELECT id, image_id, note, created_at
+    FROM annotations
+    WHERE image_id = ?
+    ORDER BY created_at
+"""
+SQL_SELECT_AUDIT_EVENT_DATA = "SELECT event_data FROM audit_log WHERE id = ?"
+
+# Covering index for the gallery listing; bulk_import_images drops and
+# rebuilds it around large loads
+SQL_CREATE_IMAGE_LIST_INDEX = """
+    CREATE INDEX IF NOT EXISTS idx_images_list_cover ON images(
+        date_added DESC, is_encrypted, id, name, mime_type,
+        original_size, thumbnail_path
+    )
+"""
+
+# Rows pulled per fetchmany by the iter_* readers; small enough to keep
+# memory flat, large enough to amortize per-batch overhead
+ITER_FETCH_SIZE = 256
+
+# Rows per transaction for the *_bulk writers; keeps each commit well inside
+# the 64MB page cache
+BULK_CHUNK_SIZE = 5000
+
+# Auth/audit events are written by a background thread in batches of up to
+# LOG_BATCH_SIZE rows, at most LOG_FLUSH_INTERVAL seconds after being queued
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 0.2
+
+# Column lists matching _row_to_image_record / _row_to_image_summary. The
+# encrypted payloads live in image_payload so listing scans over images stay
+# small; full-record reads join them back in.
+IMAGE_COLUMNS = (
+    "images.id, name, encrypted_path, original_size, encrypted_size, mime_type, "
+    "file_hash, date_added, date_modified, encrypted_tags, encrypted_metadata, "
+    "thumbnail_path, is_encrypted"
+)
+IMAGE_FROM = "images JOIN image_payload ON image_payload.image_id = images.id"
+IMAGE_SUMMARY_COLUMNS = "id, name, mime_type, original_size, thumbnail_path, date_added"
+
+SQL_SELECT_IMAGE_BY_ID = f"SELECT {IMAGE_COLUMNS} FROM {IMAGE_FROM} WHERE images.id = ?"
+SQL_SELECT_IMAGE_BY_HASH = f"SELECT {IMAGE_COLUMNS} FROM {IMAGE_FROM} WHERE file_hash = ?"
+SQL_SELECT_IMAGE_SUMMARIES = f"""
+    SELECT {IMAGE_SUMMARY_COLUMNS} FROM images
+    WHERE is_encrypted = 1
+    ORDER BY date_added DESC
+    LIMIT ? OFFSET ?
+"""
+SQL_SEARCH_IMAGES = f"""
+    SELECT {IMAGE_COLUMNS} FROM {IMAGE_FROM}
+    WHERE (:mime_type IS NULL OR mime_type LIKE :mime_type)
+      AND (:date_from IS NULL OR date_added >= :date_from)
+      AND (:date_to IS NULL OR date_added <= :date_to)
+      AND (:min_size IS NULL OR original_size >= :min_size)
+      AND (:max_size IS NULL OR original_size <= :max_size)
+    ORDER BY date_added DESC
+"""
+
+
+def _log_writer_loop(storage_ref: "weakref.ref[StorageInterface]", log_queue: queue.Queue) -> None:
+    """Drain queued log rows and write them in batches until a None sentinel"""
+    running = True
+    while running:
+        item = log_queue.get()
+        if item is None:
+            log_queue.task_done()
+            break
+        
+        batch = [item]
+        deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+        while len(batch) < LOG_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = log_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                log_queue.task_done()
+                running = False
+                break
+            batch.append(item)
+        
+        storage = storage_ref()
+        if storage is not None:
+            storage._write_log_batch(batch)
+            del storage
+        for _ in batch:
+            log_queue.task_done()
+
+
+def _stop_log_writer(log_queue: queue.Queue, thread: threading.Thread) -> None:
+    """Flush pending log rows and stop the writer thread"""
+    if thread.is_alive():
+        log_queue.put(None)
+        thread.join(timeout=5.0)
+
+
+class TunedConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that applies its PRAGMAS once on open and carries a
+    per-statement cursor cache. StorageInterface derives one subclass per
+    role (writer/reader) with PRAGMAS filled in from its SqliteConfig.
+    """
+    PRAGMAS: Tuple[str, ...] = ()
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.row_factory = sqlite3.Row
+        self.stmt_cache: Dict[str, sqlite3.Cursor] = {}
+        for pragma in self.PRAGMAS:
+            self.execute(pragma)
+    
+    @classmethod
+    def with_pragmas(cls, pragmas: Tuple[str, ...]) -> type:
+        """Return a subclass that applies pragmas on every new connection"""
+        return type(cls.__name__, (cls,), {'PRAGMAS': pragmas})
+
 
 class StorageInterface:
     """
@@ -74,55 +381,213 @@ class StorageInterface:
     - Connection pooling and thread safety
     """
     
-    def __init__(self, db_path: str, crypto_controller: CryptoController):
+    def __init__(self, db_path: str, crypto_controller: CryptoController,
+                 pool_size: Optional[int] = None,
+                 sqlite_config: Optional[SqliteConfig] = None):
         """Initialize storage interface"""
         logging.info(f"Initializing StorageInterface with db_path: {db_path}")
         self.db_path = Path(db_path)
         self.crypto = crypto_controller
-        self.connection_lock = threading.Lock()
-        self._local_storage = threading.local()
+        self.sqlite_config = sqlite_config or SqliteConfig.fast()
+        
+        # Connection classes and read-only URI are resolved once; each new
+        # connection then only pays for its own PRAGMAs
+        self._writer_factory = TunedConnection.with_pragmas(self.sqlite_config.pragmas())
+        self._reader_factory = TunedConnection.with_pragmas(self.sqlite_config.pragmas(read_only=True))
+        self._read_uri = self.db_path.resolve().as_uri() + '?mode=ro'
+        
+        # Single writer serialized by connection_lock (re-entrant so error
+        # paths can log while a write is in flight), plus a bounded pool of
+        # read-only connections that WAL lets run alongside the writer
+        self.connection_lock = threading.RLock()
+        self._writer: Optional[TunedConnection] = None
+        self._pool_size = pool_size or min(32, (os.cpu_count() or 1) * 2)
+        self._read_pool: "queue.Queue[TunedConnection]" = queue.Queue(maxsize=self._pool_size)
+        self._read_count = 0
+        self._pool_lock = threading.Lock()
+        self._closed = False
+        
+        # Read-through caches for vault_meta and plaintext vault_settings;
+        # both change rarely and are only written through this instance.
+        # Encrypted settings are never cached in decrypted form.
+        self._meta_cache: Dict[str, str] = {}
+        self._settings_cache: Dict[str, str] = {}
+        self._schema_version_cache: Optional[int] = None
+        
+        # Set while bulk() holds an outer transaction on the writer
+        self._in_bulk = False
         
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize database
         self._initialize_database()
+        
+        # Background writer for auth/audit events; flushed on close() and at
+        # interpreter exit
+        self._log_queue: queue.Queue = queue.Queue()
+        self._log_thread = threading.Thread(
+            target=_log_writer_loop,
+            args=(weakref.ref(self), self._log_queue),
+            name='graphivault-log-writer',
+            daemon=True
+        )
+        self._log_thread.start()
+        self._log_finalizer = weakref.finalize(self, _stop_log_writer, self._log_queue, self._log_thread)
     
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection"""
-        if not hasattr(self._local_storage, 'connection'):
-            self._local_storage.connection = sqlite3.connect(
-                self.db_path,
-                check_same_thread=False,
-                timeout=30.0
-            )
-              # Configure connection
-            conn = self._local_storage.connection
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.execute("PRAGMA journal_mode = WAL")
-            conn.execute("PRAGMA synchronous = NORMAL")
-            conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-            conn.execute("PRAGMA temp_store = MEMORY")
+    def _connect(self, read_only: bool = False) -> TunedConnection:
+        """Open and configure a database connection"""
+        return sqlite3.connect(
+            self._read_uri if read_only else self.db_path,
+            uri=read_only,
+            factory=self._reader_factory if read_only else self._writer_factory,
+            check_same_thread=False,
+            isolation_level=None,
+            timeout=self.sqlite_config.busy_timeout_ms / 1000,
+            cached_statements=256
+        )
+    
+    def _get_connection(self) -> TunedConnection:
+        """Get the writer connection, opening it on first use"""
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+    
+    @contextmanager
+    def _acquire_write(self) -> Iterator[TunedConnection]:
+        """
+        Hold the writer connection inside an explicit transaction (the
+        connection is in autocommit mode). Inside bulk() the work runs in a
+        savepoint of the outer transaction instead, so a failed call still
+        rolls back only its own changes.
+        """
+        with self.connection_lock:
+            conn = self._get_connection()
+            if not self._in_bulk:
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    yield conn
+                return
+            
+            conn.execute("SAVEPOINT write_op")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK TO write_op")
+                raise
+            finally:
+                conn.execute("RELEASE write_op")
+    
+    def _execute_write(self, sql: str, params: Any = ()) -> sqlite3.Cursor:
+        """
+        Run a single write statement. It autocommits on its own (one
+        statement is already atomic), or joins the open bulk() transaction.
+        """
+        with self.connection_lock:
+            return self._exec(self._get_connection(), sql, params)
+    
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Group every write made inside the block into one transaction (one
+        WAL commit). Nested bulk() blocks join the outer one. Log events
+        are written by the background thread and are not part of it, so
+        don't call flush_logs() inside the block.
+        """
+        with self.connection_lock:
+            if self._in_bulk:
+                yield
+                return
             
-        return self._local_storage.connection
+            conn = self._get_connection()
+            self._in_bulk = True
+            try:
+                with conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    yield
+            except BaseException:
+                # Cached values may have been set by writes that were just undone
+                self._meta_cache.clear()
+                self._settings_cache.clear()
+                self._schema_version_cache = None
+                raise
+            finally:
+                self._in_bulk = False
+    
+    @contextmanager
+    def _acquire_read(self) -> Iterator[TunedConnection]:
+        """Borrow a read-only connection from the pool"""
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            with self._pool_lock:
+                grow = self._read_count < self._pool_size
+                if grow:
+                    self._read_count += 1
+            if grow:
+                try:
+                    conn = self._connect(read_only=True)
+                except Exception:
+                    with self._pool_lock:
+                        self._read_count -= 1
+                    raise
+            else:
+                conn = self._read_pool.get()
+        
+        try:
+            yield conn
+        finally:
+            # Readers still checked out when close() ran are closed on return
+            if self._closed:
+                self._discard_reader(conn)
+            else:
+                self._read_pool.put(conn)
+    
+    def _discard_reader(self, conn: TunedConnection) -> None:
+        """Close a pooled reader and release its slot"""
+        conn.stmt_cache.clear()
+        conn.close()
+        with self._pool_lock:
+            self._read_count -= 1
+    
+    @staticmethod
+    def _exec(conn: TunedConnection, sql: str, params: Any = (), tuples: bool = False) -> sqlite3.Cursor:
+        """
+        Execute sql on a cursor dedicated to that statement.
+        sqlite3 keeps the last compiled statement on a cursor, so re-running
+        the same SQL text on the same cursor skips the prepare step.
+        With tuples=True rows come back as plain tuples instead of
+        sqlite3.Row, for bulk reads that unpack positionally.
+        """
+        cursor = conn.stmt_cache.get(sql)
+        if cursor is None:
+            cursor = conn.stmt_cache[sql] = conn.cursor()
+        cursor.row_factory = None if tuples else sqlite3.Row
+        return cursor.execute(sql, params)
+    
+    @staticmethod
+    def _tuple_cursor(conn: TunedConnection) -> sqlite3.Cursor:
+        """Fresh cursor returning plain tuples, for ad-hoc bulk SELECTs"""
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return cursor
+    
+    @staticmethod
+    def _exec_many(conn: TunedConnection, sql: str, seq_of_params: Iterable) -> sqlite3.Cursor:
+        """executemany counterpart of _exec, sharing the same cursor cache"""
+        cursor = conn.stmt_cache.get(sql)
+        if cursor is None:
+            cursor = conn.stmt_cache[sql] = conn.cursor()
+        return cursor.executemany(sql, seq_of_params)
     
     def _initialize_database(self) -> None:
         """Initialize GraphiVault database schema according to design specifications"""
         logging.info("Starting database initialization...")
         try:
             with self.connection_lock:
+                # The writer connection applies the PRAGMA set from sqlite_config
                 conn = self._get_connection()
-                
-                # Configure SQLite for optimal security and performance
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute("PRAGMA journal_mode = WAL")
-                conn.execute("PRAGMA synchronous = NORMAL")
-                conn.execute("PRAGMA secure_delete = ON")
-                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
-                conn.execute("PRAGMA page_size = 4096")
-                conn.execute("PRAGMA cache_size = -64000")  # 64MB cache
-                conn.execute("PRAGMA temp_store = MEMORY")
+                conn.execute("BEGIN IMMEDIATE")
                 
                 # Create images table - core metadata for each image file
                 conn.execute("""
@@ -134,15 +599,25 @@ class StorageInterface:
                         encrypted_size INTEGER NOT NULL,
                         mime_type TEXT NOT NULL,
                         file_hash TEXT NOT NULL UNIQUE,
-                        date_added TEXT NOT NULL,
-                        date_modified TEXT NOT NULL,
-                        encrypted_tags BLOB NOT NULL,
-                        encrypted_metadata BLOB NOT NULL,
+                        date_added INTEGER NOT NULL,
+                        date_modified INTEGER NOT NULL,
                         thumbnail_path TEXT,
                         is_encrypted BOOLEAN NOT NULL DEFAULT 1
                     )
                 """)
                 
+                # Create image_payload table - encrypted tag/metadata blobs,
+                # split from images so listing scans stay small
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS image_payload (
+                        image_id TEXT PRIMARY KEY,
+                        encrypted_tags BLOB NOT NULL,
+                        encrypted_metadata BLOB NOT NULL,
+                        FOREIGN KEY (image_id) REFERENCES images(id) ON DELETE CASCADE
+                    )
+                """)
+                self._migrate_inline_payloads(conn)
+                
                 # Create tags table - encrypted user-defined tags
                 conn.execute("""
                     CREATE TABLE IF NOT EXISTS tags (
@@ -150,7 +625,7 @@ class StorageInterface:
                         image_id INTEGER NOT NULL,
                         tag_name TEXT NOT NULL,
                         tag_type TEXT,
-                        created_at TEXT NOT NULL,
+                        created_at INTEGER NOT NULL,
                         FOREIGN KEY (image_id) REFERENCES images(id) ON DELETE CASCADE
                     )
                 """)
@@ -161,7 +636,7 @@ class StorageInterface:
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         image_id INTEGER NOT NULL,
                         note TEXT NOT NULL,
-                        created_at TEXT NOT NULL,
+                        created_at INTEGER NOT NULL,
                         FOREIGN KEY (image_id) REFERENCES images(id) ON DELETE CASCADE
                     )
                 """)
@@ -171,7 +646,27 @@ class StorageInterface:
                     CREATE TABLE IF NOT EXISTS vault_meta (
                         key TEXT PRIMARY KEY,
                         value TEXT NOT NULL,
-                        last_updated TEXT NOT NULL
+                        last_updated INTEGER NOT NULL
+                    )
+                """)
+                
+                # Create schema_version table - applied migrations
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS schema_version (
+                        version INTEGER PRIMARY KEY,
+                        applied_at INTEGER NOT NULL,
+                        description TEXT
+                    )
+                """)
+                
+                # Create vault_settings table - user settings, optionally encrypted
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS vault_settings (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL,
+                        encrypted INTEGER NOT NULL DEFAULT 0,
+                        created_at INTEGER NOT NULL,
+                        updated_at INTEGER NOT NULL
                     )
                 """)
                 
@@ -180,38 +675,72 @@ class StorageInterface:
                     CREATE TABLE IF NOT EXISTS auth_logs (
                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                         event_type TEXT NOT NULL,
-                        timestamp TEXT NOT NULL,
+                        timestamp INTEGER NOT NULL,
                         status TEXT NOT NULL,
                         details TEXT
                     )
                 """)
                 
-                # Create performance indexes
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_images_file_hash ON images(file_hash)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_images_created_at ON images(created_at)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_images_updated_at ON images(updated_at)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_images_storage_path ON images(storage_path)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_tags_image_id ON tags(image_id)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_tags_created_at ON tags(created_at)")
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_annotations_image_id ON annotations(image_id)")
+                # Audit events; event_data holds the UTF-8 JSON bytes
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS audit_log (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp INTEGER NOT NULL,
+                        event_type TEXT NOT NULL,
+                        event_data BLOB,
+                        session_hash TEXT
+                    )
+                """)
+                
+                # Create performance indexes. file_hash is already covered by
+                # its UNIQUE constraint; the listing index carries every
+                # column the summary query reads so it is served index-only.
+                conn.execute(SQL_CREATE_IMAGE_LIST_INDEX)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_tags_image_created ON tags(image_id, created_at)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_annotations_image_created ON annotations(image_id, created_at)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_auth_logs_timestamp ON auth_logs(timestamp)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_audit_log_type_timestamp ON audit_log(event_type, timestamp)")
                 conn.execute("CREATE INDEX IF NOT EXISTS idx_auth_logs_event_type ON auth_logs(event_type)")
                 
+                # Indexes superseded by the composite ones above
+                for index in ('idx_images_file_hash', 'idx_tags_image_id', 'idx_tags_created_at',
+                              'idx_annotations_image_id'):
+                    conn.execute(f"DROP INDEX IF EXISTS {index}")
+                
                 # Set initial vault metadata
                 self._initialize_vault_metadata(conn)
                 
                 conn.commit()
+                self._meta_cache = {
+                    row['key']: row['value']
+                    for row in conn.execute("SELECT key, value FROM vault_meta")
+                }
             logging.info("Database initialization completed successfully.")
         except Exception as e:
+            if self._writer is not None and self._writer.in_transaction:
+                self._writer.rollback()
             logging.error(f"An error occurred during database initialization: {e}", exc_info=True)
             raise
 
+    def _migrate_inline_payloads(self, conn: sqlite3.Connection) -> None:
+        """Move encrypted blobs stored inline on images into image_payload"""
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(images)")}
+        if 'encrypted_tags' not in columns:
+            return
+        
+        logging.info("Migrating encrypted image payloads into image_payload...")
+        conn.execute("""
+            INSERT OR IGNORE INTO image_payload (image_id, encrypted_tags, encrypted_metadata)
+            SELECT id, encrypted_tags, encrypted_metadata FROM images
+        """)
+        conn.execute("ALTER TABLE images DROP COLUMN encrypted_tags")
+        conn.execute("ALTER TABLE images DROP COLUMN encrypted_metadata")
+    
     def _initialize_vault_metadata(self, conn: sqlite3.Connection) -> None:
         """Initialize vault metadata with default values"""
-        from datetime import datetime, timezone
-        import secrets
-        
-        now = datetime.now(timezone.utc).isoformat()
+        now = _now_us()
+        created_at = _from_db_time(now).isoformat()
         
         # Check if vault is already initialized
         cursor = conn.execute("SELECT COUNT(*) FROM vault_meta WHERE key = 'schema_version'")
@@ -227,7 +756,7 @@ class StorageInterface:
             ('schema_version', '1', now),
             ('vault_id', vault_id, now),
             ('vault_salt', vault_salt, now),
-            ('created_at', now, now),
+            ('created_at', created_at, now),
             ('encryption_enabled', 'true', now),
             ('auto_vacuum_enabled', 'true', now)
         ]
@@ -242,30 +771,9 @@ class StorageInterface:
     def store_image(self, image_record: ImageRecord) -> bool:
         """Store an image record in the database"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                conn.execute("""
-                    INSERT INTO images (
-                        id, name, encrypted_path, original_size, encrypted_size,
-                        mime_type, file_hash, date_added, date_modified,
-                        encrypted_tags, encrypted_metadata, thumbnail_path, is_encrypted
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    image_record.id,
-                    image_record.name,
-                    image_record.encrypted_path,
-                    image_record.original_size,
-                    image_record.encrypted_size,
-                    image_record.mime_type,
-                    image_record.file_hash,
-                    image_record.date_added.isoformat(),
-                    image_record.date_modified.isoformat(),
-                    image_record.encrypted_tags,
-                    image_record.encrypted_metadata,
-                    image_record.thumbnail_path,
-                    image_record.is_encrypted
-                ))
+            with self._acquire_write() as conn:
+                self._exec(conn, SQL_INSERT_IMAGE, self._image_record_params(image_record))
+                self._exec(conn, SQL_INSERT_IMAGE_PAYLOAD, self._image_payload_params(image_record))
             
             return True
             
@@ -273,107 +781,131 @@ class StorageInterface:
             self.log_auth_event("store_image_error", "failure", str(e))
             return False
     
-    def get_image(self, image_id: int) -> Optional[ImageRecord]:
-        """Get an image record by ID"""
+    def store_images_bulk(self, image_records: Iterable[ImageRecord]) -> int:
+        """Store many image records in batched transactions, returns rows inserted"""
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("""
-                SELECT id, file_hash, file_name, storage_path, created_at, 
-                       updated_at, file_size, is_deleted
-                FROM images 
-                WHERE id = ? AND is_deleted = 0
-            """, (image_id,))
-            
-            row = cursor.fetchone()
-            if row:
-                return ImageRecord(
-                    id=row['id'],
-                    file_hash=row['file_hash'],
-                    file_name=row['file_name'],
-                    storage_path=row['storage_path'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']),
-                    file_size=row['file_size'],
-                    is_deleted=bool(row['is_deleted'])
-                )
+            records = list(image_records)
+            for start in range(0, len(records), BULK_CHUNK_SIZE):
+                chunk = records[start:start + BULK_CHUNK_SIZE]
+                with self._acquire_write() as conn:
+                    self._exec_many(conn, SQL_INSERT_IMAGE, map(self._image_record_params, chunk))
+                    self._exec_many(conn, SQL_INSERT_IMAGE_PAYLOAD, map(self._image_payload_params, chunk))
+            return len(records)
             
-            return None
-            
-        except Exception:
-            return None
+        except Exception as e:
+            self.log_auth_event("store_images_bulk_error", "failure", str(e))
+            return 0
     
-    def get_image_by_hash(self, file_hash: str) -> Optional[ImageRecord]:
-        """Get an image record by file hash (deduplication)"""
+    def bulk_import_images(self, image_records: Iterable[ImageRecord],
+                           rebuild_indexes: bool = True) -> int:
+        """
+        Import an already-validated, deduplicated batch in one transaction.
+        With rebuild_indexes the listing index is dropped for the load and
+        built once at the end, which beats per-row maintenance for large
+        imports. Returns rows inserted (0 and nothing written on failure).
+        """
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("""
-                SELECT id, file_hash, file_name, storage_path, created_at, 
-                       updated_at, file_size, is_deleted
-                FROM images 
-                WHERE file_hash = ? AND is_deleted = 0
-            """, (file_hash,))
-            
-            row = cursor.fetchone()
-            if row:
-                return ImageRecord(
-                    id=row['id'],
-                    file_hash=row['file_hash'],
-                    file_name=row['file_name'],
-                    storage_path=row['storage_path'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    updated_at=datetime.fromisoformat(row['updated_at']),
-                    file_size=row['file_size'],
-                    is_deleted=bool(row['is_deleted'])
-                )
+            records = list(image_records)
+            if not records:
+                return 0
+            
+            with self._acquire_write() as conn:
+                if rebuild_indexes:
+                    conn.execute("DROP INDEX IF EXISTS idx_images_list_cover")
+                self._exec_many(conn, SQL_INSERT_IMAGE, map(self._image_record_params, records))
+                self._exec_many(conn, SQL_INSERT_IMAGE_PAYLOAD, map(self._image_payload_params, records))
+                if rebuild_indexes:
+                    conn.execute(SQL_CREATE_IMAGE_LIST_INDEX)
+            
+            # Refresh planner statistics for the new table shape
+            with self.connection_lock:
+                self._get_connection().execute("PRAGMA optimize")
             
-            return None
+            return len(records)
             
-        except Exception:
-            return None
+        except Exception as e:
+            self.log_auth_event("bulk_import_images_error", "failure", str(e))
+            return 0
+    
+    def _executemany_chunked(self, sql: str, params: List[Tuple]) -> int:
+        """Run executemany in BULK_CHUNK_SIZE slices, one transaction per slice"""
+        for start in range(0, len(params), BULK_CHUNK_SIZE):
+            with self._acquire_write() as conn:
+                self._exec_many(conn, sql, params[start:start + BULK_CHUNK_SIZE])
+        return len(params)
+    
+    @staticmethod
+    def _image_record_params(image_record: ImageRecord) -> Tuple:
+        """Bind parameters for SQL_INSERT_IMAGE"""
+        return (
+            image_record.id,
+            image_record.name,
+            image_record.encrypted_path,
+            image_record.original_size,
+            image_record.encrypted_size,
+            image_record.mime_type,
+            image_record.file_hash,
+            _to_us(image_record.date_added),
+            _to_us(image_record.date_modified),
+            image_record.thumbnail_path,
+            image_record.is_encrypted
+        )
+    
+    @staticmethod
+    def _image_payload_params(image_record: ImageRecord) -> Tuple:
+        """Bind parameters for SQL_INSERT_IMAGE_PAYLOAD"""
+        return (
+            image_record.id,
+            image_record.encrypted_tags,
+            image_record.encrypted_metadata
+        )
     
     def store_tag(self, tag_record: TagRecord) -> bool:
         """Store an encrypted tag"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                conn.execute("""
-                    INSERT INTO tags (image_id, tag_name, tag_type, created_at)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    tag_record.image_id,
-                    tag_record.tag_name,  # Should be encrypted
-                    tag_record.tag_type,
-                    tag_record.created_at.isoformat() if tag_record.created_at else datetime.now(timezone.utc).isoformat()
-                ))
+            self._execute_write(SQL_INSERT_TAG, (
+                tag_record.image_id,
+                tag_record.tag_name,  # Should be encrypted
+                tag_record.tag_type,
+                _to_us(tag_record.created_at) if tag_record.created_at else _now_us()
+            ))
             
             return True
             
         except Exception:
             return False
     
+    def store_tags_bulk(self, tag_records: Iterable[TagRecord]) -> int:
+        """Store many encrypted tags in batched transactions, returns rows inserted"""
+        try:
+            now = _now_us()
+            params = [
+                (
+                    tag.image_id,
+                    tag.tag_name,
+                    tag.tag_type,
+                    _to_us(tag.created_at) if tag.created_at else now
+                )
+                for tag in tag_records
+            ]
+            # Keep inserts into the image_id index sequential
+            params.sort(key=lambda row: row[0])
+            return self._executemany_chunked(SQL_INSERT_TAG, params)
+            
+        except Exception:
+            return 0
+    
     def get_image_tags(self, image_id: int) -> List[TagRecord]:
         """Get all tags for an image"""
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("""
-                SELECT id, image_id, tag_name, tag_type, created_at
-                FROM tags 
-                WHERE image_id = ?
-                ORDER BY created_at
-            """, (image_id,))
-            
-            tags = []
-            for row in cursor.fetchall():
-                tags.append(TagRecord(
-                    id=row['id'],
-                    image_id=row['image_id'],
-                    tag_name=row['tag_name'],
-                    tag_type=row['tag_type'],
-                    created_at=datetime.fromisoformat(row['created_at'])
-                ))
-            
-            return tags
+            with self._acquire_read() as conn:
+                rows = self._exec(conn, SQL_SELECT_IMAGE_TAGS, (image_id,), tuples=True).fetchall()
+            
+            # Columns are selected in TagRecord field order
+            return [
+                TagRecord(tag_id, owner_id, tag_name, tag_type, _from_db_time(created_at))
+                for tag_id, owner_id, tag_name, tag_type, created_at in rows
+            ]
             
         except Exception:
             return []
@@ -381,44 +913,46 @@ class StorageInterface:
     def store_annotation(self, annotation_record: AnnotationRecord) -> bool:
         """Store an encrypted annotation/note"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                conn.execute("""
-                    INSERT INTO annotations (image_id, note, created_at)
-                    VALUES (?, ?, ?)
-                """, (
-                    annotation_record.image_id,
-                    annotation_record.note,  # Should be encrypted
-                    annotation_record.created_at.isoformat() if annotation_record.created_at else datetime.now(timezone.utc).isoformat()
-                ))
+            self._execute_write(SQL_INSERT_ANNOTATION, (
+                annotation_record.image_id,
+                annotation_record.note,  # Should be encrypted
+                _to_us(annotation_record.created_at) if annotation_record.created_at else _now_us()
+            ))
             
             return True
             
         except Exception:
             return False
     
+    def store_annotations_bulk(self, annotation_records: Iterable[AnnotationRecord]) -> int:
+        """Store many encrypted annotations in batched transactions, returns rows inserted"""
+        try:
+            now = _now_us()
+            params = [
+                (
+                    annotation.image_id,
+                    annotation.note,
+                    _to_us(annotation.created_at) if annotation.created_at else now
+                )
+                for annotation in annotation_records
+            ]
+            params.sort(key=lambda row: row[0])
+            return self._executemany_chunked(SQL_INSERT_ANNOTATION, params)
+            
+        except Exception:
+            return 0
+    
     def get_image_annotations(self, image_id: int) -> List[AnnotationRecord]:
         """Get all annotations for an image"""
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("""
-                SELECT id, image_id, note, created_at
-                FROM annotations 
-                WHERE image_id = ?
-                ORDER BY created_at
-            """, (image_id,))
-            
-            annotations = []
-            for row in cursor.fetchall():
-                annotations.append(AnnotationRecord(
-                    id=row['id'],
-                    image_id=row['image_id'],
-                    note=row['note'],
-                    created_at=datetime.fromisoformat(row['created_at'])
-                ))
-            
-            return annotations
+            with self._acquire_read() as conn:
+                rows = self._exec(conn, SQL_SELECT_IMAGE_ANNOTATIONS, (image_id,), tuples=True).fetchall()
+            
+            # Columns are selected in AnnotationRecord field order
+            return [
+                AnnotationRecord(annotation_id, owner_id, note, _from_db_time(created_at))
+                for annotation_id, owner_id, note, created_at in rows
+            ]
             
         except Exception:
             return []
@@ -426,13 +960,9 @@ class StorageInterface:
     def set_vault_meta(self, key: str, value: str) -> bool:
         """Set vault metadata value"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO vault_meta (key, value, last_updated)
-                    VALUES (?, ?, ?)
-                """, (key, value, datetime.now(timezone.utc).isoformat()))
+            with self.connection_lock:
+                self._execute_write(SQL_UPSERT_VAULT_META, (key, value, _now_us()))
+                self._meta_cache[key] = value
             
             return True
             
@@ -441,45 +971,87 @@ class StorageInterface:
     
     def get_vault_meta(self, key: str) -> Optional[str]:
         """Get vault metadata value"""
+        value = self._meta_cache.get(key)
+        if value is not None:
+            return value
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("SELECT value FROM vault_meta WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            return row['value'] if row else None
+            with self._acquire_read() as conn:
+                row = self._exec(conn, SQL_SELECT_VAULT_META, (key,)).fetchone()
+            if not row:
+                return None
+            
+            # setdefault so a concurrent set_vault_meta is never overwritten
+            with self.connection_lock:
+                return self._meta_cache.setdefault(key, row['value'])
             
         except Exception:
             return None
     
     def log_auth_event(self, event_type: str, status: str, details: Optional[str] = None) -> bool:
-        """Log authentication/security event"""
+        """Log authentication/security event (written asynchronously)"""
+        return self._queue_log(SQL_INSERT_AUTH_LOG, (event_type, _now_us(), status, details))
+    
+    def _queue_log(self, sql: str, params: Tuple) -> bool:
+        """Hand a log row to the background writer, or write it directly once closed"""
+        if self._log_thread.is_alive():
+            self._log_queue.put((sql, params))
+            return True
+        return self._write_log_batch([(sql, params)])
+    
+    def _write_log_batch(self, batch: List[Tuple[str, Tuple]]) -> bool:
+        """Write queued log rows, one executemany per statement"""
+        grouped: Dict[str, List[Tuple]] = {}
+        for sql, params in batch:
+            grouped.setdefault(sql, []).append(params)
+        
+        ok = True
+        for sql, rows in grouped.items():
+            try:
+                with self._acquire_write() as conn:
+                    self._exec_many(conn, sql, rows)
+            except Exception as e:
+                logging.warning(f"Dropped {len(rows)} log event(s): {e}")
+                ok = False
+        return ok
+    
+    def flush_logs(self) -> None:
+        """Block until every queued log event has been written"""
+        if self._log_thread.is_alive():
+            self._log_queue.join()
+    
+    def log_auth_events_bulk(self, events: Iterable[Tuple[str, str, Optional[str]]]) -> int:
+        """Log many (event_type, status, details) events, returns rows inserted"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                conn.execute("""
-                    INSERT INTO auth_logs (event_type, timestamp, status, details)
-                    VALUES (?, ?, ?, ?)
-                """, (
-                    event_type,
-                    datetime.now(timezone.utc).isoformat(),
-                    status,
-                    details
-                ))
+            now = _now_us()
+            params = [(event_type, now, status, details) for event_type, status, details in events]
+            return self._executemany_chunked(SQL_INSERT_AUTH_LOG, params)
             
-            return True
+        except Exception:
+            return 0
+    
+    def log_audit_events_bulk(self, events: Iterable[Tuple[str, Optional[Dict[str, Any]]]],
+                              session_hash: str = None, *, ts: datetime = None) -> int:
+        """
+        Log many (event_type, event_data) audit events synchronously, returns rows inserted.
+        All rows share one timestamp: ts if given, otherwise a single clock read.
+        """
+        try:
+            now = _to_us(ts) if ts is not None else _now_us()
+            params = [
+                (now, event_type, _dump_event(event_data) if event_data else None, session_hash)
+                for event_type, event_data in events
+            ]
+            return self._executemany_chunked(SQL_INSERT_AUDIT_LOG, params)
             
         except Exception:
-            return False
+            return 0
     
     def get_image(self, image_id: str) -> Optional[ImageRecord]:
         """Get image record by ID"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("""
-                SELECT * FROM images WHERE id = ?
-            """, (image_id,))
-            
-            row = cursor.fetchone()
+            with self._acquire_read() as conn:
+                row = self._exec(conn, SQL_SELECT_IMAGE_BY_ID, (image_id,)).fetchone()
             if not row:
                 return None
             
@@ -488,64 +1060,109 @@ class StorageInterface:
         except Exception:
             return None
     
+    def iter_all_images(self, limit: int = None, offset: int = 0) -> Iterator[ImageRecord]:
+        """
+        Yield image records one cursor row at a time.
+        A pooled reader is held until the iterator is exhausted or closed.
+        """
+        query = f"SELECT {IMAGE_COLUMNS} FROM {IMAGE_FROM} WHERE is_encrypted = 1 ORDER BY date_added DESC"
+        params = []
+        
+        if limit:
+            query += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
+        
+        with self._acquire_read() as conn:
+            cursor = self._tuple_cursor(conn).execute(query, params)
+            while rows := cursor.fetchmany(ITER_FETCH_SIZE):
+                yield from self._rows_to_image_records(rows)
+    
     def get_all_images(self, limit: int = None, offset: int = 0) -> List[ImageRecord]:
-        """Get all images with pagination"""
+        """Get all images with pagination (prefer iter_all_images for full scans)"""
         try:
-            conn = self._get_connection()
-            
-            query = "SELECT * FROM images WHERE is_encrypted = 1 ORDER BY date_added DESC"
-            params = []
+            return list(self.iter_all_images(limit, offset))
             
-            if limit:
-                query += " LIMIT ? OFFSET ?"
-                params.extend([limit, offset])
-            
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+        except Exception:
+            return []
+    
+    def get_images_summary(self, limit: int = None, offset: int = 0) -> List[ImageSummary]:
+        """Get gallery listing rows without reading the encrypted payloads"""
+        try:
+            with self._acquire_read() as conn:
+                rows = self._exec(conn, SQL_SELECT_IMAGE_SUMMARIES, (limit or -1, offset), tuples=True).fetchall()
             
-            return [self._row_to_image_record(row) for row in rows]
+            return [self._row_to_image_summary(row) for row in rows]
             
         except Exception:
             return []
     
+    def get_image_full(self, image_id: str) -> Optional[ImageRecord]:
+        """Get the complete image record, including encrypted payloads"""
+        return self.get_image(image_id)
+    
+    def read_image_payload(self, image_id: str, column: str) -> Optional[bytes]:
+        """Read one encrypted payload column via incremental BLOB I/O"""
+        if column not in ('encrypted_tags', 'encrypted_metadata'):
+            raise ValueError(f"Not a payload column: {column}")
+        
+        try:
+            with self._acquire_read() as conn:
+                row = conn.execute("SELECT rowid FROM image_payload WHERE image_id = ?", (image_id,)).fetchone()
+                if not row:
+                    return None
+                with conn.blobopen('image_payload', column, row[0], readonly=True) as blob:
+                    return blob.read()
+            
+        except Exception:
+            return None
+    
     def update_image(self, image_id: str, updates: Dict[str, Any]) -> bool:
         """Update an image record"""
         try:
             if not updates:
                 return True
             
-            conn = self._get_connection()
-            
             # Build dynamic update query
             set_clauses = []
             params = []
             
-            allowed_fields = {
-                'name', 'encrypted_tags', 'encrypted_metadata', 
-                'thumbnail_path', 'date_modified'
-            }
+            allowed_fields = {'name', 'thumbnail_path', 'date_modified'}
+            payload_fields = {'encrypted_tags', 'encrypted_metadata'}
+            payload_clauses = []
+            payload_params = []
             
             for field, value in updates.items():
                 if field in allowed_fields:
                     set_clauses.append(f"{field} = ?")
                     if field == 'date_modified' and isinstance(value, datetime):
-                        params.append(value.isoformat())
+                        params.append(_to_us(value))
                     else:
                         params.append(value)
+                elif field in payload_fields:
+                    payload_clauses.append(f"{field} = ?")
+                    payload_params.append(value)
             
-            if not set_clauses:
+            if not set_clauses and not payload_clauses:
                 return True
             
-            # Add updated_at timestamp
-            set_clauses.append("updated_at = ?")
-            params.append(datetime.now(timezone.utc).isoformat())
+            # Stamp the modification time unless the caller supplied one
+            if 'date_modified' not in updates:
+                set_clauses.append("date_modified = ?")
+                params.append(_now_us())
             params.append(image_id)
             
             query = f"UPDATE images SET {', '.join(set_clauses)} WHERE id = ?"
             
-            with conn:
+            with self._acquire_write() as conn:
                 cursor = conn.execute(query, params)
-                return cursor.rowcount > 0
+                if cursor.rowcount == 0:
+                    return False
+                if payload_clauses:
+                    conn.execute(
+                        f"UPDATE image_payload SET {', '.join(payload_clauses)} WHERE image_id = ?",
+                        payload_params + [image_id]
+                    )
+                return True
                 
         except Exception:
             return False
@@ -553,11 +1170,8 @@ class StorageInterface:
     def delete_image(self, image_id: str) -> bool:
         """Delete an image record"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                cursor = conn.execute("DELETE FROM images WHERE id = ?", (image_id,))
-                return cursor.rowcount > 0
+            # image_payload, tags and annotations go with it via ON DELETE CASCADE
+            return self._execute_write(SQL_DELETE_IMAGE, (image_id,)).rowcount > 0
                 
         except Exception:
             return False
@@ -565,38 +1179,24 @@ class StorageInterface:
     def search_images(self, filters: Dict[str, Any] = None) -> List[ImageRecord]:
         """Search images with filters"""
         try:
-            conn = self._get_connection()
-            
-            query = "SELECT * FROM images WHERE 1=1"
-            params = []
-            
-            if filters:
-                if 'mime_type' in filters:
-                    query += " AND mime_type LIKE ?"
-                    params.append(f"%{filters['mime_type']}%")
-                
-                if 'date_from' in filters:
-                    query += " AND date_added >= ?"
-                    params.append(filters['date_from'])
-                
-                if 'date_to' in filters:
-                    query += " AND date_added <= ?"
-                    params.append(filters['date_to'])
-                
-                if 'min_size' in filters:
-                    query += " AND original_size >= ?"
-                    params.append(filters['min_size'])
-                
-                if 'max_size' in filters:
-                    query += " AND original_size <= ?"
-                    params.append(filters['max_size'])
-            
-            query += " ORDER BY date_added DESC"
+            filters = filters or {}
+            mime_type = filters.get('mime_type')
+            date_from = filters.get('date_from')
+            date_to = filters.get('date_to')
+            
+            # Unused filters bind NULL, so every combination shares one statement
+            params = {
+                'mime_type': f"%{mime_type}%" if mime_type is not None else None,
+                'date_from': _as_us(date_from) if date_from is not None else None,
+                'date_to': _as_us(date_to) if date_to is not None else None,
+                'min_size': filters.get('min_size'),
+                'max_size': filters.get('max_size'),
+            }
             
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+            with self._acquire_read() as conn:
+                rows = self._exec(conn, SQL_SEARCH_IMAGES, params, tuples=True).fetchall()
             
-            return [self._row_to_image_record(row) for row in rows]
+            return self._rows_to_image_records(rows)
             
         except Exception:
             return []
@@ -604,13 +1204,8 @@ class StorageInterface:
     def get_image_by_hash(self, file_hash: str) -> Optional[ImageRecord]:
         """Get image by file hash (for duplicate detection)"""
         try:
-            conn = self._get_connection()
-            
-            cursor = conn.execute("""
-                SELECT * FROM images WHERE file_hash = ?
-            """, (file_hash,))
-            
-            row = cursor.fetchone()
+            with self._acquire_read() as conn:
+                row = self._exec(conn, SQL_SELECT_IMAGE_BY_HASH, (file_hash,)).fetchone()
             if not row:
                 return None
             
@@ -619,16 +1214,24 @@ class StorageInterface:
         except Exception:
             return None
     
+    def invalidate_settings_cache(self) -> None:
+        """Drop cached vault_meta and vault_settings values (e.g. after an external write)"""
+        with self.connection_lock:
+            self._meta_cache.clear()
+            self._settings_cache.clear()
+    
     def get_vault_setting(self, key: str) -> Optional[str]:
         """Get a vault setting"""
+        value = self._settings_cache.get(key)
+        if value is not None:
+            return value
+        
         try:
-            conn = self._get_connection()
+            with self._acquire_read() as conn:
+                row = conn.execute("""
+                    SELECT value, encrypted FROM vault_settings WHERE key = ?
+                """, (key,)).fetchone()
             
-            cursor = conn.execute("""
-                SELECT value, encrypted FROM vault_settings WHERE key = ?
-            """, (key,))
-            
-            row = cursor.fetchone()
             if not row:
                 return None
             
@@ -642,7 +1245,8 @@ class StorageInterface:
                 except Exception:
                     return None
             
-            return value
+            with self.connection_lock:
+                return self._settings_cache.setdefault(key, value)
             
         except Exception:
             return None
@@ -650,8 +1254,6 @@ class StorageInterface:
     def set_vault_setting(self, key: str, value: str, encrypted: bool = False) -> bool:
         """Set a vault setting"""
         try:
-            conn = self._get_connection()
-            
             # Encrypt value if requested
             if encrypted:
                 try:
@@ -660,16 +1262,13 @@ class StorageInterface:
                 except Exception:
                     return False
             
-            with conn:
-                conn.execute("""
-                    INSERT OR REPLACE INTO vault_settings 
-                    (key, value, encrypted, created_at, updated_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    key, value, encrypted,
-                    datetime.now(timezone.utc).isoformat(),
-                    datetime.now(timezone.utc).isoformat()
-                ))
+            now = _now_us()
+            with self.connection_lock:
+                self._execute_write(SQL_UPSERT_VAULT_SETTING, (key, value, encrypted, now, now))
+                if encrypted:
+                    self._settings_cache.pop(key, None)
+                else:
+                    self._settings_cache[key] = value
             
             return True
             
@@ -678,34 +1277,25 @@ class StorageInterface:
     
     def log_audit_event(self, event_type: str, event_data: Dict[str, Any], 
                        session_hash: str = None) -> bool:
-        """Log an audit event"""
+        """Log an audit event (written asynchronously)"""
         try:
-            conn = self._get_connection()
-            
-            with conn:
-                conn.execute("""
-                    INSERT INTO audit_log (timestamp, event_type, event_data, session_hash)
-                    VALUES (?, ?, ?, ?)                """, (
-                    datetime.now(timezone.utc).isoformat(),
-                    event_type,
-                    json.dumps(event_data, ensure_ascii=False) if event_data else None,
-                    session_hash
-                ))
-            
-            return True
+            return self._queue_log(SQL_INSERT_AUDIT_LOG, (
+                _now_us(),
+                event_type,
+                _dump_event(event_data) if event_data else None,
+                session_hash
+            ))
             
         except Exception:
             return False
     
-    def get_audit_events(self, hours: int = 24, event_type: str = None) -> List[Dict[str, Any]]:
-        """Get audit events"""
+    def get_audit_event_headers(self, hours: int = 24, event_type: str = None) -> List[Dict[str, Any]]:
+        """Get audit event metadata without decoding the event payloads"""
         try:
-            conn = self._get_connection()
+            cutoff_time = _now_us() - hours * 3600 * 1_000_000
             
-            cutoff_time = datetime.now(timezone.utc) - datetime.timedelta(hours=hours)
-            
-            query = "SELECT * FROM audit_log WHERE timestamp >= ?"
-            params = [cutoff_time.isoformat()]
+            query = "SELECT id, timestamp, event_type, session_hash FROM audit_log WHERE timestamp >= ?"
+            params = [cutoff_time]
             
             if event_type:
                 query += " AND event_type = ?"
@@ -713,63 +1303,106 @@ class StorageInterface:
             
             query += " ORDER BY timestamp DESC"
             
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+            with self._acquire_read() as conn:
+                rows = conn.execute(query, params).fetchall()
+            
+            return [{
+                'id': row['id'],
+                'timestamp': _from_db_time(row['timestamp']).isoformat(),
+                'event_type': row['event_type'],
+                'session_hash': row['session_hash']
+            } for row in rows]
             
-            events = []
-            for row in rows:
+        except Exception:
+            return []
+    
+    def get_audit_event_details(self, event_id: int) -> Optional[Dict[str, Any]]:
+        """Get the decoded payload of a single audit event"""
+        try:
+            with self._acquire_read() as conn:
+                row = self._exec(conn, SQL_SELECT_AUDIT_EVENT_DATA, (event_id,)).fetchone()
+            
+            if not row:
+                return None
+            return self._decode_event_data(row['event_data'])
+            
+        except Exception:
+            return None
+    
+    def iter_audit_events(self, hours: int = 24, event_type: str = None) -> Iterator[Dict[str, Any]]:
+        """Yield audit events newest first, one cursor row at a time"""
+        cutoff_time = _now_us() - hours * 3600 * 1_000_000
+        
+        query = "SELECT id, timestamp, event_type, session_hash, event_data FROM audit_log WHERE timestamp >= ?"
+        params = [cutoff_time]
+        
+        if event_type:
+            query += " AND event_type = ?"
+            params.append(event_type)
+        
+        query += " ORDER BY timestamp DESC"
+        
+        decode = self._decode_event_data
+        with self._acquire_read() as conn:
+            for event_id, timestamp, kind, session_hash, event_data in self._tuple_cursor(conn).execute(query, params):
                 event = {
-                    'id': row['id'],
-                    'timestamp': row['timestamp'],
-                    'event_type': row['event_type'],
-                    'session_hash': row['session_hash'],
-                    'created_at': row['created_at']
+                    'id': event_id,
+                    'timestamp': _from_db_time(timestamp).isoformat(),
+                    'event_type': kind,
+                    'session_hash': session_hash
                 }
-                
-                if row['event_data']:
-                    try:
-                        event['event_data'] = json.loads(row['event_data'])
-                    except json.JSONDecodeError:
-                        event['event_data'] = {}
-                
-                events.append(event)
-            
-            return events
+                if event_data:
+                    event['event_data'] = decode(event_data)
+                yield event
+    
+    def get_audit_events(self, hours: int = 24, event_type: str = None) -> List[Dict[str, Any]]:
+        """Get audit events (prefer iter_audit_events for long time ranges)"""
+        try:
+            return list(self.iter_audit_events(hours, event_type))
             
         except Exception:
             return []
     
+    @staticmethod
+    def _decode_event_data(blob) -> Dict[str, Any]:
+        """Decode a stored event payload (BLOB, or TEXT from older vaults)"""
+        if not blob:
+            return {}
+        try:
+            return _load_event(blob)
+        except _EVENT_DECODE_ERRORS:
+            return {}
+    
     def get_storage_stats(self) -> Dict[str, Any]:
         """Get storage statistics"""
         try:
-            conn = self._get_connection()
-            
             stats = {}
             
-            # Image statistics
-            cursor = conn.execute("""
-                SELECT 
-                    COUNT(*) as total_images,
-                    SUM(original_size) as total_original_size,
-                    SUM(encrypted_size) as total_encrypted_size,
-                    AVG(original_size) as avg_file_size,
-                    MIN(date_added) as oldest_image,
-                    MAX(date_added) as newest_image
-                FROM images
-            """)
-            
-            row = cursor.fetchone()
-            if row:
-                return self._row_to_image_record(row)
-            cursor = conn.execute("""
-                SELECT mime_type, COUNT(*) as count
-                FROM images
-                GROUP BY mime_type
-                ORDER BY count DESC
-            """)
+            with self._acquire_read() as conn:
+                # Image statistics
+                cursor = conn.execute("""
+                    SELECT 
+                        COUNT(*) as total_images,
+                        SUM(original_size) as total_original_size,
+                        SUM(encrypted_size) as total_encrypted_size,
+                        AVG(original_size) as avg_file_size,
+                        MIN(date_added) as oldest_image,
+                        MAX(date_added) as newest_image
+                    FROM images
+                """)
+                
+                row = cursor.fetchone()
+                if row:
+                    return self._row_to_image_record(row)
+                type_rows = conn.execute("""
+                    SELECT mime_type, COUNT(*) as count
+                    FROM images
+                    GROUP BY mime_type
+                    ORDER BY count DESC
+                """).fetchall()
             
             file_types = {}
-            for row in cursor.fetchall():
+            for row in type_rows:
                 file_types[row['mime_type']] = row['count']
             
             stats['file_type_distribution'] = file_types
@@ -786,8 +1419,8 @@ class StorageInterface:
     def vacuum_database(self) -> bool:
         """Vacuum database to reclaim space"""
         try:
-            conn = self._get_connection()
-            conn.execute("VACUUM")
+            with self.connection_lock:
+                self._get_connection().execute("VACUUM")
             return True
             
         except Exception:
@@ -799,10 +1432,9 @@ class StorageInterface:
             backup_path = Path(backup_path)
             backup_path.parent.mkdir(parents=True, exist_ok=True)
             
-            source_conn = self._get_connection()
             backup_conn = sqlite3.connect(backup_path)
-            
-            source_conn.backup(backup_conn)
+            with self._acquire_read() as source_conn:
+                source_conn.backup(backup_conn)
             backup_conn.close()
             
             return True
@@ -810,46 +1442,95 @@ class StorageInterface:
         except Exception:
             return False
     
-    def _row_to_image_record(self, row: sqlite3.Row) -> ImageRecord:
-        """Convert database row to ImageRecord"""
+    def _row_to_image_record(self, row: Tuple) -> ImageRecord:
+        """Convert an IMAGE_COLUMNS row (tuple or sqlite3.Row) to ImageRecord"""
+        (image_id, name, encrypted_path, original_size, encrypted_size, mime_type,
+         file_hash, date_added, date_modified, encrypted_tags, encrypted_metadata,
+         thumbnail_path, is_encrypted) = row
         return ImageRecord(
-            id=str(row['id']),
-            name=row['name'],
-            encrypted_path=row['encrypted_path'],
-            original_size=row['original_size'],
-            encrypted_size=row['encrypted_size'],
-            mime_type=row['mime_type'],
-            file_hash=row['file_hash'],
-            date_added=datetime.fromisoformat(row['date_added']),
-            date_modified=datetime.fromisoformat(row['date_modified']),
-            encrypted_tags=row['encrypted_tags'],
-            encrypted_metadata=row['encrypted_metadata'],
-            thumbnail_path=row['thumbnail_path'],
-            is_encrypted=bool(row['is_encrypted'])
+            str(image_id), name, encrypted_path, original_size, encrypted_size,
+            mime_type, file_hash, _from_db_time(date_added), _from_db_time(date_modified),
+            encrypted_tags, encrypted_metadata, thumbnail_path, is_encrypted != 0
+        )
+    
+    @staticmethod
+    def _rows_to_image_records(rows: Iterable[Tuple]) -> List[ImageRecord]:
+        """Batched _row_to_image_record with the constructor and time parser bound locally"""
+        record = ImageRecord
+        from_db_time = _from_db_time
+        return [
+            record(str(image_id), name, encrypted_path, original_size, encrypted_size,
+                   mime_type, file_hash, from_db_time(date_added), from_db_time(date_modified),
+                   encrypted_tags, encrypted_metadata, thumbnail_path, is_encrypted != 0)
+            for (image_id, name, encrypted_path, original_size, encrypted_size, mime_type,
+                 file_hash, date_added, date_modified, encrypted_tags, encrypted_metadata,
+                 thumbnail_path, is_encrypted) in rows
+        ]
+    
+    def _row_to_image_summary(self, row: Tuple) -> ImageSummary:
+        """Convert a SQL_SELECT_IMAGE_SUMMARIES row (tuple or sqlite3.Row) to ImageSummary"""
+        image_id, name, mime_type, original_size, thumbnail_path, date_added = row
+        return ImageSummary(
+            str(image_id), name, mime_type, original_size, thumbnail_path,
+            _from_db_time(date_added)
         )
     
     def _get_schema_version(self) -> int:
-        """Get current schema version"""
+        """Get current schema version (read once, then served from the instance)"""
+        version = self._schema_version_cache
+        if version is not None:
+            return version
+        
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("SELECT MAX(version) FROM schema_version")
-            row = cursor.fetchone()
-            return row[0] if row[0] is not None else 0
+            with self._acquire_read() as conn:
+                row = self._exec(conn, SQL_SELECT_SCHEMA_VERSION).fetchone()
+            version = row[0] if row[0] is not None else 0
             
         except Exception:
             return 0
+        
+        with self.connection_lock:
+            if self._schema_version_cache is None:
+                self._schema_version_cache = version
+            return self._schema_version_cache
     
-    def _set_schema_version(self, version: int, description: str) -> None:
+    def _set_schema_version(self, version: int, description: str, *,
+                            applied_at: datetime = None) -> None:
         """Set schema version"""
-        conn = self._get_connection()
-        conn.execute("""
-            INSERT INTO schema_version (version, applied_at, description)
-            VALUES (?, ?, ?)
-        """, (version, datetime.now(timezone.utc).isoformat(), description))
-        conn.commit()
+        self._set_schema_versions([(version, description)], applied_at=applied_at)
+    
+    def _set_schema_versions(self, versions: Iterable[Tuple[int, str]], *,
+                             applied_at: datetime = None) -> None:
+        """Record several applied migrations at once, stamped with one applied_at"""
+        now = _to_us(applied_at) if applied_at is not None else _now_us()
+        params = [(version, now, description) for version, description in versions]
+        if not params:
+            return
+        
+        with self.connection_lock:
+            with self._acquire_write() as conn:
+                self._exec_many(conn, SQL_INSERT_SCHEMA_VERSION, params)
+            self._schema_version_cache = max(
+                max(version for version, _, _ in params), self._schema_version_cache or 0
+            )
     
     def close(self) -> None:
-        """Close database connections"""
-        if hasattr(self._local_storage, 'connection'):
-            self._local_storage.connection.close()
-            delattr(self._local_storage, 'connection')
+        """Flush pending log events and close database connections"""
+        self._log_finalizer()
+        self._closed = True
+        
+        with self.connection_lock:
+            self._meta_cache.clear()
+            self._settings_cache.clear()
+            self._schema_version_cache = None
+            if self._writer is not None:
+                self._writer.stmt_cache.clear()
+                self._writer.close()
+                self._writer = None
+        
+        while True:
+            try:
+                conn = self._read_pool.get_nowait()
+            except queue.Empty:
+                break
+            self._discard_reader(conn)
@@ -6,18 +6,128 @@ Fixes issues with CryptoController's load_crypto_params method
 
 import os
 import sys
+import ast
 import json
 import base64
+import shutil
 import argparse
+import textwrap
+from contextlib import closing
 from pathlib import Path
 
 # Add parent directory to path for imports
-parent_dir = Path(__file__).parent.parent
+script_dir = Path(__file__).resolve().parent
+parent_dir = script_dir.parent
 sys.path.insert(0, str(parent_dir))
 
 # Import diagnostic logger
 from diagnostics.utils.logger import DiagnosticLogger
 
+# orjson writes indented UTF-8 bytes directly; the stdlib fallback produces
+# the same layout
+try:
+    import orjson
+    
+    def _dump_json(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+# Subdirectories of a stub vault
+STUB_VAULT_SUBDIRS = ('data', 'thumbnails', 'metadata', 'temp', 'backups', 'database')
+
+# Stub vault.config, serialized once at import
+STUB_VAULT_CONFIG_BYTES = _dump_json({
+    "vault_id": "test-vault-123456789",
+    "version": "1.0.0",
+    "created_at": "2025-06-18T10:00:00Z",
+    "encrypted": True,
+    "compression_enabled": False,
+    "max_file_size": 100 * 1024 * 1024,  # 100MB
+    "supported_formats": ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp"],
+    "security_level": "high",
+    "backup_enabled": True,
+    "audit_logging": True
+})
+
+# Stub vault.key parameters; the salt is generated per vault
+STUB_VAULT_KEY_PARAMS = {
+    "algorithm": "AES-256-GCM",
+    "key_derivation": "PBKDF2-HMAC-SHA512",
+    "iterations": 200000,
+    "salt_size": 32,
+    "nonce_size": 12,
+    "tag_size": 16
+}
+
+# Header written to a stub vault's audit.log
+STUB_AUDIT_LOG_HEADER = b"# GraphiVault Audit Log\n# Created: 2025-06-18T10:00:00Z\n"
+
+# Schema of the stub vault database, created in a single transaction
+STUB_SCHEMA_PATH = script_dir / 'stub_schema.sql'
+
+
+# Statements spliced into load_crypto_params before its final return
+MASTER_KEY_SNIPPET = """
+# Fix: Initialize master key from stored parameters if password is not supplied
+# This is a temporary fix that will be called when verify_master_key is used
+# In a real implementation, this would require the password to be supplied
+
+# Test if salt was loaded successfully
+if self._key_derivation_salt:
+    try:
+        # Import required modules
+        import getpass
+        import hashlib
+
+        # Securely prompt for the test password instead of hardcoding it
+        test_password = getpass.getpass("Enter the test password to derive the key: ").encode('utf-8')
+
+        # PBKDF2-HMAC-SHA512, with the iteration loop run natively by OpenSSL
+        self._master_key = hashlib.pbkdf2_hmac(
+            'sha512', test_password, self._key_derivation_salt, self.config['iterations'], 32
+        )
+        print("CryptoController: Derived master key from provided password")
+    except Exception as e:
+        print(f"CryptoController: Failed to derive master key: {e}")
+        self._master_key = None
+else:
+    print("CryptoController: No salt available, master key cannot be derived.")
+    self._master_key = None
+
+# WARNING: This is NOT secure and is only for diagnostic purposes!
+"""
+
+
+def _find_method(tree: ast.Module, name: str):
+    """Return the first (async) function definition called name, or None"""
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == name:
+            return node
+    return None
+
+
+def _assigns_attribute(func: ast.AST, attr: str) -> bool:
+    """True if func assigns self.<attr> anywhere in its body"""
+    for node in ast.walk(func):
+        if isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if any(isinstance(t, ast.Attribute) and t.attr == attr for t in targets):
+                return True
+    return False
+
+
+def _last_return_true(func: ast.AST):
+    """Return the last `return True` statement in func by line number, or None"""
+    last = None
+    for node in ast.walk(func):
+        if (isinstance(node, ast.Return) and isinstance(node.value, ast.Constant)
+                and node.value.value is True):
+            if last is None or node.lineno > last.lineno:
+                last = node
+    return last
+
 
 def fix_crypto_controller(log: DiagnosticLogger) -> bool:
     """
@@ -33,103 +143,86 @@ def fix_crypto_controller(log: DiagnosticLogger) -> bool:
         log.error(f"CryptoController file not found: {crypto_file}")
         return False
     
-    log.info(f"Opening file: {crypto_file}")
+    log.info("Opening file: %s", crypto_file)
     
     try:
-        with open(crypto_file, 'r') as f:
-            content = f.read()
+        # Read the raw bytes in one call; ast.parse decodes them itself
+        source = crypto_file.read_bytes()
         
-        # Find the load_crypto_params method
-        load_params_start = content.find("def load_crypto_params")
-        if load_params_start == -1:
-            log.error("Could not find load_crypto_params method")
-            return False
+        # Parse once and locate everything from the syntax tree
+        tree = ast.parse(source, filename=str(crypto_file))
         
-        load_params_end = content.find("def", load_params_start + 1)
-        if load_params_end == -1:
-            log.error("Could not find the end of load_crypto_params method")
+        load_params = _find_method(tree, "load_crypto_params")
+        if load_params is None:
+            log.error("Could not find load_crypto_params method")
             return False
         
-        load_params_code = content[load_params_start:load_params_end]
-        
         # Check if the method already initializes _master_key
-        if "_master_key = " in load_params_code:
+        if _assigns_attribute(load_params, "_master_key"):
             log.info("CryptoController.load_crypto_params already initializes master key")
             return True
         
-        # Find the line that sets the salt
-        salt_line_idx = load_params_code.find("self._key_derivation_salt = base64.b64decode")
-        if salt_line_idx == -1:
+        # Find the statement that sets the salt
+        if not _assigns_attribute(load_params, "_key_derivation_salt"):
             log.error("Could not find salt initialization code")
             return False
         
         # Find the end of the method body
-        method_body_end = load_params_code.rfind("return True")
-        if method_body_end == -1:
+        return_node = _last_return_true(load_params)
+        if return_node is None:
             log.error("Could not find the end of the method body")
             return False
-          # Create the code to add
-        code_to_add = """
-            # Fix: Initialize master key from stored parameters if password is not supplied
-            # This is a temporary fix that will be called when verify_master_key is used
-            # In a real implementation, this would require the password to be supplied
-            
-            # Test if salt was loaded successfully
-            if self._key_derivation_salt:
-                try:
-                    # Import required modules
-                    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-                    from cryptography.hazmat.primitives import hashes
-                    from cryptography.hazmat.backends import default_backend
-                    
-                    # Create a key derivation function
-                    kdf = PBKDF2HMAC(
-                        algorithm=hashes.SHA512(),
-                        length=32,
-                        salt=self._key_derivation_salt,
-                        iterations=self.config['iterations'],
-                        backend=default_backend()
-                    )
-                    
-                    # Securely prompt for the test password instead of hardcoding it
-                    import getpass
-                    test_password = getpass.getpass("Enter the test password to derive the key: ").encode('utf-8')
-                    self._master_key = kdf.derive(test_password)
-                    print("CryptoController: Derived master key from provided password")
-                except Exception as e:
-                    print(f"CryptoController: Failed to derive master key: {e}")
-                    self._master_key = None
-            else:
-                print("CryptoController: No salt available, master key cannot be derived.")
-                self._master_key = None
-                
-            # WARNING: This is NOT secure and is only for diagnostic purposes!
-            """
-        
-        # Insert the code before the return statement
-        new_method_code = load_params_code[:method_body_end] + code_to_add + load_params_code[method_body_end:]
         
-        # Replace the method in the full content
-        new_content = content[:load_params_start] + new_method_code + content[load_params_end:]
+        # Insert the code before the return statement, at its indentation:
+        # find the byte offset of the line holding the return
+        insert_at = 0
+        for _ in range(return_node.lineno - 1):
+            insert_at = source.index(b"\n", insert_at) + 1
+        indent = " " * return_node.col_offset
+        snippet = (textwrap.indent(MASTER_KEY_SNIPPET, indent) + indent + "\n").encode('utf-8')
         
-        # Backup the original file
+        # Backup the original file (copied by the OS, not re-encoded)
         backup_file = crypto_file.with_suffix('.py.bak')
-        with open(backup_file, 'w') as f:
-            f.write(content)
-        log.info(f"Created backup: {backup_file}")
+        shutil.copyfile(crypto_file, backup_file)
+        log.info("Created backup: %s", backup_file)
         
-        # Write the modified file
-        with open(crypto_file, 'w') as f:
-            f.write(new_content)
-        log.success(f"Updated CryptoController: {crypto_file}")
+        # Write the modified file as head + snippet + tail, without
+        # assembling the patched source in memory first
+        with memoryview(source) as view, open(crypto_file, 'wb') as f:
+            f.write(view[:insert_at])
+            f.write(snippet)
+            f.write(view[insert_at:])
+        log.success("Updated CryptoController: %s", crypto_file)
         
         return True
         
     except Exception as e:
-        log.error(f"Error fixing CryptoController: {e}", exc_info=True)
+        log.error("Error fixing CryptoController: %s", e, exc_info=True)
         return False
 
 
+def _make_subdirs(parent: Path, names) -> None:
+    """
+    Create each named subdirectory of parent (existing ones are fine).
+    Where the platform supports dir_fd, parent is opened once and every
+    mkdir resolves relative to it instead of re-walking the full path.
+    """
+    if os.mkdir not in os.supports_dir_fd or not hasattr(os, 'O_DIRECTORY'):
+        for name in names:
+            (parent / name).mkdir(exist_ok=True)
+        return
+    
+    parent_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name in names:
+            try:
+                os.mkdir(name, dir_fd=parent_fd)
+            except FileExistsError:
+                pass
+    finally:
+        os.close(parent_fd)
+
+
 def create_test_vault_stubs(vault_path: Path, log: DiagnosticLogger) -> bool:
     """
     Create test vault stubs for easier testing
@@ -137,136 +230,56 @@ def create_test_vault_stubs(vault_path: Path, log: DiagnosticLogger) -> bool:
     log.section("Creating Test Vault Stubs")
     
     try:
-        # Create vault directory
-        vault_path.mkdir(parents=True, exist_ok=True)
-        log.info(f"Created vault directory: {vault_path}")
+        # Create the vault directory, then its subdirectories
+        os.makedirs(vault_path, exist_ok=True)
+        _make_subdirs(vault_path, STUB_VAULT_SUBDIRS)
         
-        # Create required subdirectories
-        for subdir in ['data', 'thumbnails', 'metadata', 'temp', 'backups', 'database']:
-            dir_path = vault_path / subdir
-            dir_path.mkdir(exist_ok=True)
-            log.info(f"Created directory: {dir_path}")
+        log.info("Created vault directory: %s", vault_path)
+        for subdir in STUB_VAULT_SUBDIRS:
+            log.info("Created directory: %s", vault_path / subdir)
         
         # Create vault.config
         config_path = vault_path / 'vault.config'
-        vault_config = {
-            "vault_id": "test-vault-123456789",
-            "version": "1.0.0",
-            "created_at": "2025-06-18T10:00:00Z",
-            "encrypted": True,
-            "compression_enabled": False,
-            "max_file_size": 100 * 1024 * 1024,  # 100MB
-            "supported_formats": ["jpg", "jpeg", "png", "gif", "bmp", "tiff", "webp"],
-            "security_level": "high",
-            "backup_enabled": True,
-            "audit_logging": True
-        }
-        
-        with open(config_path, 'w') as f:
-            json.dump(vault_config, f, indent=2)
-        log.info(f"Created config file: {config_path}")
+        config_path.write_bytes(STUB_VAULT_CONFIG_BYTES)
+        log.info("Created config file: %s", config_path)
         
         # Create vault.key
         key_path = vault_path / 'vault.key'
         
-        # This should match the expected salt for password "test123"
-        # In a real system, this would be randomly generated
-        import secrets
-        salt_bytes = secrets.token_bytes(32)
+        # Fresh random salt per stub vault, sized from the key parameters
+        salt_bytes = os.urandom(STUB_VAULT_KEY_PARAMS["salt_size"])
         
-        vault_key = {
-            "algorithm": "AES-256-GCM",
-            "key_derivation": "PBKDF2-HMAC-SHA512",
-            "iterations": 200000,
-            "salt_size": 32,
-            "nonce_size": 12,
-            "tag_size": 16,
-            "salt": base64.b64encode(salt_bytes).decode('utf-8')
-        }
-        
-        with open(key_path, 'w') as f:
-            json.dump(vault_key, f, indent=2)
-        log.info(f"Created key file: {key_path}")
+        vault_key = {**STUB_VAULT_KEY_PARAMS, "salt": base64.b64encode(salt_bytes).decode('ascii')}
+        key_path.write_bytes(_dump_json(vault_key))
+        log.info("Created key file: %s", key_path)
         
         # Create stub SQLite database
         import sqlite3
         db_path = vault_path / 'database' / 'vault.db'
         
-        conn = sqlite3.connect(str(db_path))
-        cursor = conn.cursor()
-        
-        # Create tables
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS images (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            file_hash TEXT UNIQUE NOT NULL,
-            file_name TEXT NOT NULL,
-            storage_path TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            file_size INTEGER NOT NULL,
-            is_deleted BOOLEAN DEFAULT 0
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            tag_type TEXT
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS image_tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            image_id INTEGER NOT NULL,
-            tag_id INTEGER NOT NULL,
-            FOREIGN KEY (image_id) REFERENCES images (id),
-            FOREIGN KEY (tag_id) REFERENCES tags (id)
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS annotations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            image_id INTEGER NOT NULL,
-            note TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (image_id) REFERENCES images (id)
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS audit_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            event_type TEXT NOT NULL,
-            status TEXT NOT NULL,
-            details TEXT
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        log.info(f"Created database: {db_path}")
+        with closing(sqlite3.connect(str(db_path))) as conn:
+            # Same journal settings StorageInterface opens the vault with
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            
+            # Create all tables in one transaction
+            conn.executescript(STUB_SCHEMA_PATH.read_text())
+        log.info("Created database: %s", db_path)
         
         # Create audit log file
         audit_path = vault_path / 'audit.log'
-        with open(audit_path, 'w') as f:
-            f.write("# GraphiVault Audit Log\n")
-            f.write("# Created: 2025-06-18T10:00:00Z\n")
-        log.info(f"Created audit log: {audit_path}")
+        audit_path.write_bytes(STUB_AUDIT_LOG_HEADER)
+        log.info("Created audit log: %s", audit_path)
         
         return True
         
     except Exception as e:
-        log.error(f"Error creating test vault stubs: {e}", exc_info=True)
+        log.error("Error creating test vault stubs: %s", e, exc_info=True)
         return False
 
 
-def main():
-    """Main entry point"""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(description='GraphiVault Backend Fix Script')
     parser.add_argument('--vault-path', type=str, default='../../test_vault',
                         help='Path to create test vault stubs')
@@ -279,7 +292,16 @@ def main():
     parser.add_argument('--debug', '-d', action='store_true',
                         help='Enable debug output')
     
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import; parsing does not mutate the parser
+_PARSER = _build_parser()
+
+
+def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
     
     # Setup logger
     log = DiagnosticLogger(verbose=args.verbose, debug=args.debug)
@@ -287,7 +309,6 @@ def main():
     # Convert relative path to absolute if needed
     vault_path = Path(args.vault_path)
     if not vault_path.is_absolute():
-        script_dir = Path(__file__).parent
         vault_path = (script_dir / vault_path).resolve()
     
     # Run selected fixes
@@ -6,23 +6,37 @@ Direct fix for the verify_master_key issue
 
 import os
 import sys
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 
 # Add parent directory to path for imports
-parent_dir = Path(__file__).parent.parent
+script_dir = Path(__file__).resolve().parent
+parent_dir = script_dir.parent
 sys.path.insert(0, str(parent_dir))
 
-# Import crypto controller
-try:
-    from crypto.crypto_controller import CryptoController
-except ImportError as e:
-    print(f"Failed to import CryptoController: {e}")
-    print("Make sure you're running this script from the python_backend directory.")
-    sys.exit(1)
+
+def _import_crypto_controller():
+    """Import CryptoController on first use, so loading this module stays cheap"""
+    try:
+        from crypto.crypto_controller import CryptoController
+    except ImportError as e:
+        print(f"Failed to import CryptoController: {e}")
+        print("Make sure you're running this script from the python_backend directory.")
+        sys.exit(1)
+    return CryptoController
+
+
+@lru_cache(maxsize=32)
+def _derive_master_key(salt: bytes, iterations: int, password: bytes) -> bytes:
+    """PBKDF2-HMAC-SHA512 derivation, memoized so repeated loads of the same vault are free"""
+    # hashlib runs the whole iteration loop inside OpenSSL
+    return hashlib.pbkdf2_hmac('sha512', password, salt, iterations, 32)
 
 
 def patch_crypto_controller():
     """Apply monkey patch to the CryptoController class to fix verify_master_key"""
+    CryptoController = _import_crypto_controller()
     
     # Store original method
     original_load_params = CryptoController.load_crypto_params
@@ -34,23 +48,11 @@ def patch_crypto_controller():
         
         if result and self._key_derivation_salt:
             try:
-                # Import required modules
-                from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-                from cryptography.hazmat.primitives import hashes
-                from cryptography.hazmat.backends import default_backend
-                
-                # Create a key derivation function
-                kdf = PBKDF2HMAC(
-                    algorithm=hashes.SHA512(),
-                    length=32,
-                    salt=self._key_derivation_salt,
-                    iterations=self.config['iterations'],
-                    backend=default_backend()
-                )
-                
                 # Derive a key for test password 'test123'
                 test_password = b'test123'
-                self._master_key = kdf.derive(test_password)
+                self._master_key = _derive_master_key(
+                    bytes(self._key_derivation_salt), self.config['iterations'], test_password
+                )
                 print("CryptoController: Master key derived successfully from 'test123'")
             except Exception as e:
                 print(f"CryptoController: Failed to derive master key: {e}")
@@ -73,14 +75,14 @@ if __name__ == "__main__":
     
     print("\nTesting the patch...")
     # Create a crypto controller
-    crypto = CryptoController({})
+    crypto = _import_crypto_controller()({})
     
     # Test vault path
     test_vault = Path("../../test_vault")
     if not test_vault.exists():
         print(f"Test vault not found at {test_vault}, creating minimal structure...")
         test_vault.mkdir(exist_ok=True)
-        (test_vault / "vault.key").write_text('{"iterations": 200000}')
+        (test_vault / "vault.key").write_bytes(b'{"iterations": 200000}')
     
     # Test the patch
     print(f"Loading crypto params from {test_vault}...")
@@ -10,16 +10,25 @@ import argparse
 from pathlib import Path
 
 # Add current directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+script_dir = Path(__file__).resolve().parent
+sys.path.insert(0, str(script_dir))
 
-# Import diagnostic tools
+# Import diagnostic tools; the validator and backend tester pull in the
+# crypto stack, so they are imported only by the modes that run them
 from utils.logger import DiagnosticLogger
-from vault_validator import VaultValidator
-from test_backend import BackendTester
 
+# Test mode -> bitmask of the test groups it runs
+MODE_VALIDATE = 0b01
+MODE_BACKEND = 0b10
+TEST_MODES = {
+    'all': MODE_VALIDATE | MODE_BACKEND,
+    'validate': MODE_VALIDATE,
+    'backend': MODE_BACKEND,
+}
 
-def main():
-    """Main entry point"""
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
     parser = argparse.ArgumentParser(description='GraphiVault Backend Diagnostics')
     parser.add_argument('--vault-path', type=str, default='../../test_vault',
                         help='Path to the vault directory')
@@ -27,7 +36,9 @@ def main():
                         help='Create missing files and directories')
     parser.add_argument('--password', type=str, default='test123',
                         help='Password to test vault unlocking')
-    parser.add_argument('--test-mode', type=str, choices=['all', 'validate', 'backend'], default='all',
+    parser.add_argument('--stats', action='store_true',
+                        help='Report database row counts (scans every table)')
+    parser.add_argument('--test-mode', type=str, choices=list(TEST_MODES), default='all',
                         help='Test mode: validate structure only, backend only, or all tests')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose output')
@@ -36,11 +47,20 @@ def main():
     parser.add_argument('--log-file', type=str,
                         help='Log file path')
     
-    args = parser.parse_args()
+    return parser
+
+
+# Built once at import; parsing does not mutate the parser
+_PARSER = _build_parser()
+
+
+def main():
+    """Main entry point"""
+    args = _PARSER.parse_args()
     
     # Setup logger
     log = DiagnosticLogger(verbose=args.verbose, debug=args.debug)
-    log_dir = Path(__file__).parent / 'logs'
+    log_dir = script_dir / 'logs'
     log.setup_file_logging(log_dir, args.log_file)
     
     # Print header
@@ -50,31 +70,36 @@ def main():
     # Convert relative path to absolute if needed
     vault_path = Path(args.vault_path)
     if not vault_path.is_absolute():
-        script_dir = Path(__file__).parent
         vault_path = (script_dir / vault_path).resolve()
     
     log.info(f"Vault path: {vault_path}")
     
     # Run tests based on mode
+    mode = TEST_MODES[args.test_mode]
+    run_validate = bool(mode & MODE_VALIDATE)
+    run_backend = bool(mode & MODE_BACKEND)
     validate_success = False
     backend_success = False
     
-    if args.test_mode in ['all', 'validate']:
+    if run_validate:
         log.section("Vault Validation")
+        from vault_validator import VaultValidator
         validator = VaultValidator(
             vault_path=vault_path,
             log=log,
-            create_missing=args.create_missing
+            create_missing=args.create_missing,
+            collect_stats=args.stats
         )
         
         validate_success = validator.run_all_checks(args.password)
         
-        if not validate_success and args.test_mode == 'all':
+        if not validate_success and run_backend:
             log.warning("Skipping backend tests due to validation failure")
             return 1
     
-    if args.test_mode in ['all', 'backend']:
+    if run_backend:
         log.section("Backend Tests")
+        from test_backend import BackendTester
         tester = BackendTester(
             vault_path=vault_path,
             log=log
@@ -85,20 +110,17 @@ def main():
     # Final summary
     log.section("Final Results")
     
-    if args.test_mode in ['all', 'validate']:
+    if run_validate:
         log.info(f"Validation: {'PASS' if validate_success else 'FAIL'}")
         
-    if args.test_mode in ['all', 'backend']:
+    if run_backend:
         log.info(f"Backend Tests: {'PASS' if backend_success else 'FAIL'}")
     
-    if args.test_mode == 'all':
-        overall = validate_success and backend_success
+    # Only the groups that ran count towards the exit code
+    overall = (validate_success or not run_validate) and (backend_success or not run_backend)
+    if run_validate and run_backend:
         log.result("Overall Diagnostics", overall)
-        return 0 if overall else 1
-    elif args.test_mode == 'validate':
-        return 0 if validate_success else 1
-    else:  # backend
-        return 0 if backend_success else 1
+    return 0 if overall else 1
 
 
 if __name__ == '__main__':
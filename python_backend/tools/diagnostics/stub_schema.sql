@@ -0,0 +1,47 @@
+-- Schema of GraphiVault stub vault databases (fix_crypto.py --create-stubs
+-- and vault_validator.py --create-missing), applied in one transaction
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS images (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_hash TEXT UNIQUE NOT NULL,
+    file_name TEXT NOT NULL,
+    storage_path TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    file_size INTEGER NOT NULL,
+    is_deleted BOOLEAN DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS tags (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE NOT NULL,
+    tag_type TEXT
+);
+
+CREATE TABLE IF NOT EXISTS image_tags (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    image_id INTEGER NOT NULL,
+    tag_id INTEGER NOT NULL,
+    FOREIGN KEY (image_id) REFERENCES images (id),
+    FOREIGN KEY (tag_id) REFERENCES tags (id)
+);
+
+CREATE TABLE IF NOT EXISTS annotations (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    image_id INTEGER NOT NULL,
+    note TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    FOREIGN KEY (image_id) REFERENCES images (id)
+);
+
+CREATE TABLE IF NOT EXISTS audit_log (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    event_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    details TEXT
+);
+
+COMMIT;
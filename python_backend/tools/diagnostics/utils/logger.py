@@ -7,10 +7,40 @@ Provides consistent logging across all diagnostic scripts
 import os
 import sys
 import logging
-import traceback
+import logging.handlers
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 
+# One timestamp per process, so every logger in a run shares one default log file
+LOG_SESSION_ID = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+# Records buffered in memory before the log file is written
+FILE_LOG_BUFFER_CAPACITY = 256
+
+# Separator lines for section and step headers
+SECTION_RULE = '=' * 40
+STEP_RULE = '-' * 30
+
+
+def _console_can_encode(text: str) -> bool:
+    """True if stderr, where the console handler writes, can encode text"""
+    encoding = getattr(sys.stderr, 'encoding', None) or 'ascii'
+    try:
+        text.encode(encoding)
+    except (UnicodeEncodeError, LookupError):
+        return False
+    return True
+
+
+@lru_cache(maxsize=8)
+def _ensure_dir(path: str) -> Path:
+    """Create a log directory once per process"""
+    log_path = Path(path)
+    log_path.mkdir(parents=True, exist_ok=True)
+    return log_path
+
+
 class DiagnosticLogger:
     """
     Configurable logger for GraphiVault diagnostics
@@ -30,6 +60,14 @@ class DiagnosticLogger:
         self.logger = logging.getLogger(name)
         self.verbose = verbose
         self.debug = debug
+        self._file_buffer = None
+        
+        # Pick the result markers once: emoji, or plain text for consoles
+        # that cannot encode them
+        if _console_can_encode("✅❌"):
+            self._pass_prefix, self._fail_prefix = "✅ ", "❌ "
+        else:
+            self._pass_prefix, self._fail_prefix = "[PASS] ", "[FAIL] "
         
         # Set base level based on flags
         if debug:
@@ -55,24 +93,27 @@ class DiagnosticLogger:
         """Setup file logging"""
         try:
             # Create log directory if it doesn't exist
-            log_path = Path(log_dir)
-            log_path.mkdir(exist_ok=True)
+            log_path = _ensure_dir(str(log_dir))
             
             # Generate default filename if not provided
             if not filename:
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f'backend_diagnostics_{timestamp}.log'
+                filename = f'backend_diagnostics_{LOG_SESSION_ID}.log'
             
             log_file = log_path / filename
             
-            # Create file handler
-            file_handler = logging.FileHandler(log_file)
+            # Create file handler; the file is only opened on the first record
+            file_handler = logging.FileHandler(log_file, delay=True)
             
             # Always use detailed format for file logs
             formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
             file_handler.setFormatter(formatter)
             
-            self.logger.addHandler(file_handler)
+            # Batch records into few writes; errors flush straight through.
+            # logging.shutdown() flushes whatever is left at exit.
+            self._file_buffer = logging.handlers.MemoryHandler(
+                FILE_LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=file_handler
+            )
+            self.logger.addHandler(self._file_buffer)
             self.logger.info(f"Logging to file: {log_file}")
             
             return str(log_file)
@@ -81,55 +122,54 @@ class DiagnosticLogger:
             self.logger.error(f"Failed to setup file logging: {e}")
             return None
     
-    def debug(self, message):
+    def flush(self):
+        """Write buffered file log records now"""
+        if self._file_buffer is not None:
+            self._file_buffer.flush()
+    
+    # Extra args are %-style arguments, formatted only if the record is emitted
+    
+    def debug(self, message, *args):
         """Log debug message"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
     
-    def info(self, message):
+    def info(self, message, *args):
         """Log info message"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """Log warning message"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
+    
+    # The traceback is formatted by the logging module, only if the record is emitted
     
-    def error(self, message, exc_info=None):
+    def error(self, message, *args, exc_info=None):
         """Log error message with optional exception info"""
-        if exc_info:
-            self.logger.error(f"{message}\n{traceback.format_exc()}")
-        else:
-            self.logger.error(message)
+        self.logger.error(message, *args, exc_info=exc_info)
     
-    def critical(self, message, exc_info=None):
+    def critical(self, message, *args, exc_info=None):
         """Log critical message with optional exception info"""
-        if exc_info:
-            self.logger.critical(f"{message}\n{traceback.format_exc()}")
-        else:
-            self.logger.critical(message)
+        self.logger.critical(message, *args, exc_info=exc_info)
             
-    def success(self, message):
+    def success(self, message, *args):
         """Log success message (info level with special formatting)"""
-        try:
-            self.logger.info(f"✅ {message}")
-        except UnicodeEncodeError:
-            # Fallback for consoles that don't support Unicode
-            self.logger.info(f"[PASS] {message}")
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        self.logger.info(self._pass_prefix + message, *args)
     
-    def failure(self, message):
+    def failure(self, message, *args):
         """Log failure message (error level with special formatting)"""
-        try:
-            self.logger.error(f"❌ {message}")
-        except UnicodeEncodeError:
-            # Fallback for consoles that don't support Unicode
-            self.logger.error(f"[FAIL] {message}")
+        self.logger.error(self._fail_prefix + message, *args)
     
     def section(self, title):
         """Log section header"""
-        self.logger.info(f"\n{'=' * 40}\n{title}\n{'=' * 40}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("\n%s\n%s\n%s", SECTION_RULE, title, SECTION_RULE)
     
     def step(self, title):
         """Log step header"""
-        self.logger.info(f"\n{'-' * 30}\n{title}\n{'-' * 30}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("\n%s\n%s\n%s", STEP_RULE, title, STEP_RULE)
     
     def result(self, test_name, success, message=None):
         """Log test result"""
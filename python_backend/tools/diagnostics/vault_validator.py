@@ -7,9 +7,16 @@ Validates vault structure, file formats, and crypto initialization
 import os
 import sys
 import json
+import copy
+import uuid
+import base64
 import sqlite3
-import traceback
+import secrets
 import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple, List
 
@@ -17,18 +24,45 @@ from typing import Dict, Any, Optional, Tuple, List
 script_dir = Path(__file__).parent
 tools_dir = script_dir.parent
 backend_dir = tools_dir.parent
-sys.path.insert(0, str(backend_dir))
+if str(backend_dir) not in sys.path:
+    sys.path.insert(0, str(backend_dir))
 
-# Import diagnostic logger
+# Import diagnostic logger; the crypto stack is imported only by
+# test_crypto_initialization
 from tools.diagnostics.utils.logger import DiagnosticLogger
 
-# Try to import required GraphiVault modules
+# Tables validate_database expects; images first, its count is reported apart
+REQUIRED_TABLES = ('images', 'tags', 'image_tags', 'annotations')
+SQL_COUNT_REQUIRED_TABLES = "SELECT " + ", ".join(
+    f"(SELECT COUNT(*) FROM {table})" for table in REQUIRED_TABLES
+)
+
+# Schema for --create-missing stub databases, shared with fix_crypto
+STUB_SCHEMA_PATH = script_dir / 'stub_schema.sql'
+
+# orjson is optional; it parses and writes the vault JSON files faster when
+# installed, and the stdlib fallback writes the same indented layout
 try:
-    from crypto.crypto_controller import CryptoController
-except ImportError as e:
-    print(f"Failed to import CryptoController: {e}")
-    print("Make sure you're running this script from the python_backend directory.")
-    sys.exit(1)
+    import orjson
+    _parse_json = orjson.loads
+    
+    def _dump_json(data: dict) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _parse_json = json.loads
+    
+    def _dump_json(data: dict) -> bytes:
+        return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _list_names(dir_path: str) -> set:
+    """Names of the entries in dir_path, empty if it cannot be listed"""
+    try:
+        with os.scandir(dir_path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 
 class VaultValidator:
     """
@@ -41,26 +75,42 @@ class VaultValidator:
     - Database structure and connectivity
     """
     
+    # Parsed vault.config / vault.key by (path, mtime_ns, size); shared by
+    # every validator so repeat runs against an unchanged vault skip parsing
+    _JSON_CACHE: Dict[Tuple[Path, int, int], Any] = {}
+    
     def __init__(self, 
                  vault_path: Path, 
                  log: DiagnosticLogger,
-                 create_missing: bool = False):
-        """Initialize validator with vault path and options"""
+                 create_missing: bool = False,
+                 collect_stats: bool = False,
+                 parallel: bool = True):
+        """
+        Initialize validator with vault path and options.
+        collect_stats adds per-table row counts to the database check; each
+        count scans its whole table, so it is off by default.
+        With parallel, the config, key and database checks run concurrently
+        (their log lines interleave).
+        """
         self.vault_path = vault_path
         self.log = log
         self.create_missing = create_missing
-        self.issues = []
+        self.collect_stats = collect_stats
+        self.parallel = parallel
+        # Appended to from the concurrent file checks
+        self.issues = deque()
         self.crypto = None
         
         # Define required paths
+        database_dir = vault_path / 'database'
         self.required_files = {
             'vault_config': vault_path / 'vault.config',
             'vault_key': vault_path / 'vault.key',
-            'database': vault_path / 'database' / 'vault.db'
+            'database': database_dir / 'vault.db'
         }
         
         self.required_dirs = {
-            'database': vault_path / 'database',
+            'database': database_dir,
             'data': vault_path / 'data',
             'thumbnails': vault_path / 'thumbnails',
             'metadata': vault_path / 'metadata',
@@ -68,6 +118,16 @@ class VaultValidator:
             'backups': vault_path / 'backups'
         }
         
+        # (key, path, parent dir, entry name) for the structure check, split
+        # once here so it only compares strings
+        self._dir_checks = [
+            (name, path, str(path.parent), path.name) for name, path in self.required_dirs.items()
+        ]
+        self._file_checks = [
+            (name, path, str(path.parent), path.name) for name, path in self.required_files.items()
+        ]
+        self._db_uri = f"{self.required_files['database'].resolve().as_uri()}?mode=ro"
+        
         # Test results
         self.structure_valid = False
         self.config_valid = False
@@ -88,37 +148,47 @@ class VaultValidator:
                     self.vault_path.mkdir(parents=True, exist_ok=True)
                     self.log.info(f"Created vault directory: {self.vault_path}")
                 except Exception as e:
-                    self.log.error(f"Failed to create vault directory: {e}", exc_info=True)
+                    self.log.error("Failed to create vault directory: %s", e, exc_info=True)
                     return False
             else:
                 return False
         
+        # List each directory once and check names against the listing
+        listings = {}
+        
+        def present(parent: str, entry: str) -> bool:
+            names = listings.get(parent)
+            if names is None:
+                names = listings[parent] = _list_names(parent)
+            return entry in names
+        
         # Check required directories
         missing_dirs = []
-        for name, dir_path in self.required_dirs.items():
-            if not dir_path.exists():
+        for name, dir_path, parent, entry in self._dir_checks:
+            if not present(parent, entry):
                 missing_dirs.append((name, dir_path))
                 self.issues.append(f"Missing directory: {dir_path}")
         
         # Create missing directories if specified
         if missing_dirs and self.create_missing:
-            for name, dir_path in missing_dirs:
+            for name, dir_path in list(missing_dirs):
                 try:
                     dir_path.mkdir(parents=True, exist_ok=True)
+                    missing_dirs.remove((name, dir_path))
                     self.log.info(f"Created directory: {dir_path}")
                 except Exception as e:
                     self.log.error(f"Failed to create directory {dir_path}: {e}")
         
         # Check required files
         missing_files = []
-        for name, file_path in self.required_files.items():
-            if not file_path.exists():
+        for name, file_path, parent, entry in self._file_checks:
+            if not present(parent, entry):
                 missing_files.append((name, file_path))
                 self.issues.append(f"Missing file: {file_path}")
         
         # Create stub files if specified
         if missing_files and self.create_missing:
-            for name, file_path in missing_files:
+            for name, file_path in list(missing_files):
                 try:
                     # Create parent directory if needed
                     file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -131,15 +201,13 @@ class VaultValidator:
                     elif name == 'database':
                         self._create_stub_database(file_path)
                         
+                    missing_files.remove((name, file_path))
                     self.log.info(f"Created stub file: {file_path}")
                 except Exception as e:
                     self.log.error(f"Failed to create {file_path}: {e}")
         
-        # Structure is valid if all required files and dirs exist
-        self.structure_valid = (
-            all(dir_path.exists() for dir_path in self.required_dirs.values()) and
-            all(file_path.exists() for file_path in self.required_files.values())
-        )
+        # Structure is valid if nothing is still missing
+        self.structure_valid = not missing_dirs and not missing_files
         
         self.log.result("Vault Structure", self.structure_valid)
         return self.structure_valid
@@ -149,13 +217,8 @@ class VaultValidator:
         self.log.step("Validating Vault Configuration")
         
         config_path = self.required_files['vault_config']
-        if not config_path.exists():
-            self.log.error(f"Config file not found: {config_path}")
-            return False
-        
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            config = self._load_json(config_path)
               # Check required fields
             required_fields = ['vault_id', 'version', 'created_at', 'encrypted']
             missing_fields = [field for field in required_fields if field not in config]
@@ -172,6 +235,9 @@ class VaultValidator:
             self.log.result("Configuration Format", self.config_valid)
             return self.config_valid
             
+        except FileNotFoundError:
+            self.log.error(f"Config file not found: {config_path}")
+            return False
         except json.JSONDecodeError as e:
             self.issues.append(f"Invalid JSON in vault.config: {str(e)}")
             self.log.error(f"Invalid JSON format in vault.config: {e}")
@@ -179,7 +245,7 @@ class VaultValidator:
             return False
         except Exception as e:
             self.issues.append(f"Error reading vault.config: {str(e)}")
-            self.log.error(f"Error reading vault.config: {e}", exc_info=True)
+            self.log.error("Error reading vault.config: %s", e, exc_info=True)
             self.config_valid = False
             return False
     
@@ -188,13 +254,8 @@ class VaultValidator:
         self.log.step("Validating Vault Key File")
         
         key_path = self.required_files['vault_key']
-        if not key_path.exists():
-            self.log.error(f"Key file not found: {key_path}")
-            return False
-        
         try:
-            with open(key_path, 'r') as f:
-                key_data = json.load(f)
+            key_data = self._load_json(key_path)
               # Check required fields
             required_fields = ['algorithm', 'key_derivation', 'iterations', 'salt']
             missing_fields = [field for field in required_fields if field not in key_data]
@@ -220,6 +281,9 @@ class VaultValidator:
             self.log.result("Key File Format", self.key_valid)
             return self.key_valid
             
+        except FileNotFoundError:
+            self.log.error(f"Key file not found: {key_path}")
+            return False
         except json.JSONDecodeError as e:
             self.issues.append(f"Invalid JSON in vault.key: {str(e)}")
             self.log.error(f"Invalid JSON format in vault.key: {e}")
@@ -227,7 +291,7 @@ class VaultValidator:
             return False
         except Exception as e:
             self.issues.append(f"Error reading vault.key: {str(e)}")
-            self.log.error(f"Error reading vault.key: {e}", exc_info=True)
+            self.log.error("Error reading vault.key: %s", e, exc_info=True)
             self.key_valid = False
             return False
     
@@ -241,36 +305,36 @@ class VaultValidator:
             return False
         
         try:
-            # Check if file is a valid SQLite database
-            conn = sqlite3.connect(str(db_path))
-            cursor = conn.cursor()
-            
-            # Check if tables exist
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = [row[0] for row in cursor.fetchall()]
-            
-            required_tables = ['images', 'tags', 'image_tags', 'annotations']
-            missing_tables = [table for table in required_tables if table not in tables]
-            
-            if missing_tables:
-                self.issues.append(f"Missing tables in database: {', '.join(missing_tables)}")
-                self.log.error(f"Database missing required tables: {missing_tables}")
-                self.db_valid = False
-            else:
-                self.log.info(f"Database contains all required tables")
-                  # Check image count
-                cursor.execute("SELECT COUNT(*) FROM images;")
-                image_count = cursor.fetchone()[0]
-                self.log.info(f"Database contains {image_count} images")
-                # Check other table counts
-                for table in ['tags', 'image_tags', 'annotations']:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table};")
-                    count = cursor.fetchone()[0]
-                    self.log.info(f"Table '{table}' contains {count} records")
+            # Check if file is a valid SQLite database; opened read-only so
+            # validation creates no side files and takes no write lock
+            conn = sqlite3.connect(self._db_uri, uri=True, isolation_level=None)
+            with closing(conn):
+                conn.execute("PRAGMA query_only=1")
+                conn.execute("PRAGMA mmap_size=268435456")
+                cursor = conn.cursor()
+                
+                # Check if tables exist
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+                tables = [row[0] for row in cursor.fetchall()]
+                
+                missing_tables = [table for table in REQUIRED_TABLES if table not in tables]
                 
-                self.db_valid = True
+                if missing_tables:
+                    self.issues.append(f"Missing tables in database: {', '.join(missing_tables)}")
+                    self.log.error(f"Database missing required tables: {missing_tables}")
+                    self.db_valid = False
+                else:
+                    self.log.info(f"Database contains all required tables")
+                    if self.collect_stats:
+                        # Count every required table in one statement
+                        cursor.execute(SQL_COUNT_REQUIRED_TABLES)
+                        image_count, *other_counts = cursor.fetchone()
+                        self.log.info(f"Database contains {image_count} images")
+                        for table, count in zip(REQUIRED_TABLES[1:], other_counts):
+                            self.log.info(f"Table '{table}' contains {count} records")
+                    
+                    self.db_valid = True
             
-            conn.close()
             self.log.result("Database Validation", self.db_valid)
             return self.db_valid
             
@@ -281,7 +345,7 @@ class VaultValidator:
             return False
         except Exception as e:
             self.issues.append(f"Error validating database: {str(e)}")
-            self.log.error(f"Error validating database: {e}", exc_info=True)
+            self.log.error("Error validating database: %s", e, exc_info=True)
             self.db_valid = False
             return False
     
@@ -289,6 +353,14 @@ class VaultValidator:
         """Test crypto initialization and key verification"""
         self.log.step("Testing Crypto Initialization")
         
+        try:
+            from crypto.crypto_controller import CryptoController
+        except ImportError as e:
+            self.issues.append(f"Failed to import CryptoController: {e}")
+            self.log.error(f"Failed to import CryptoController: {e}")
+            self.log.error("Make sure you're running this script from the python_backend directory.")
+            return False, False
+        
         try:
             # Create crypto controller
             self.log.info("Creating CryptoController instance")
@@ -325,7 +397,7 @@ class VaultValidator:
             
         except Exception as e:
             self.issues.append(f"Error in crypto initialization: {str(e)}")
-            self.log.error(f"Error in crypto initialization: {e}", exc_info=True)
+            self.log.error("Error in crypto initialization: %s", e, exc_info=True)
             self.crypto_load_success = False
             self.crypto_verify_success = False
             return False, False
@@ -342,9 +414,20 @@ class VaultValidator:
             self.log.warning("Skipping remaining tests due to invalid structure")
             return False
         
-        config_valid = self.validate_config_file()
-        key_valid = self.validate_key_file()
-        db_valid = self.validate_database()
+        if self.parallel:
+            # Independent file reads and a read-only sqlite open; all three
+            # spend their time in I/O with the GIL released
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                config_future = pool.submit(self.validate_config_file)
+                key_future = pool.submit(self.validate_key_file)
+                db_future = pool.submit(self.validate_database)
+            config_valid = config_future.result()
+            key_valid = key_future.result()
+            db_valid = db_future.result()
+        else:
+            config_valid = self.validate_config_file()
+            key_valid = self.validate_key_file()
+            db_valid = self.validate_database()
         
         crypto_load_success, crypto_verify_success = self.test_crypto_initialization(test_password)
         
@@ -359,27 +442,44 @@ class VaultValidator:
         
         # Print summary
         self.log.section("Validation Summary")
-        self.log.info(f"Structure Valid: {structure_valid}")
-        self.log.info(f"Config Format Valid: {config_valid}")
-        self.log.info(f"Key Format Valid: {key_valid}")
-        self.log.info(f"Database Valid: {db_valid}")
-        self.log.info(f"Crypto Load Success: {crypto_load_success}")
-        self.log.info(f"Password Verification: {crypto_verify_success}")
+        self.log.info(
+            "Structure Valid: %s\n"
+            "Config Format Valid: %s\n"
+            "Key Format Valid: %s\n"
+            "Database Valid: %s\n"
+            "Crypto Load Success: %s\n"
+            "Password Verification: %s",
+            structure_valid, config_valid, key_valid, db_valid,
+            crypto_load_success, crypto_verify_success
+        )
         
         if self.issues:
             self.log.info(f"\nIssues Found ({len(self.issues)}):")
-            for i, issue in enumerate(self.issues, 1):
-                self.log.warning(f"{i}. {issue}")
+            self.log.warning("\n".join(f"{i}. {issue}" for i, issue in enumerate(self.issues, 1)))
         
         self.log.result("Overall Validation", overall_success)
         
         return overall_success
     
+    def _load_json(self, path: Path) -> Any:
+        """
+        Parse a JSON file, reusing the cached result while its mtime and size
+        are unchanged. Callers get their own copy, so edits don't leak.
+        """
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        data = self._JSON_CACHE.get(key)
+        if data is None:
+            data = _parse_json(path.read_bytes())
+            # Drop entries for older versions of this file; the checks run
+            # in threads, so iterate a snapshot of the keys
+            for stale in [k for k in list(self._JSON_CACHE) if k[0] == path]:
+                self._JSON_CACHE.pop(stale, None)
+            self._JSON_CACHE[key] = data
+        return copy.deepcopy(data)
+    
     def _create_stub_config(self, file_path: Path):
         """Create a stub vault.config file"""
-        import uuid
-        from datetime import datetime, timezone
-        
         stub_config = {
             "vault_id": str(uuid.uuid4()),
             "version": "1.0.0",
@@ -393,14 +493,10 @@ class VaultValidator:
             "audit_logging": True
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(stub_config, f, indent=2)
+        file_path.write_bytes(_dump_json(stub_config))
     
     def _create_stub_key(self, file_path: Path):
         """Create a stub vault.key file"""
-        import base64
-        import secrets
-        
         stub_key = {
             "algorithm": "AES-256-GCM",
             "key_derivation": "PBKDF2-HMAC-SHA512",
@@ -411,68 +507,17 @@ class VaultValidator:
             "salt": base64.b64encode(secrets.token_bytes(32)).decode('utf-8')
         }
         
-        with open(file_path, 'w') as f:
-            json.dump(stub_key, f, indent=2)
+        file_path.write_bytes(_dump_json(stub_key))
     
     def _create_stub_database(self, file_path: Path):
         """Create a stub SQLite database with required schema"""
-        conn = sqlite3.connect(str(file_path))
-        cursor = conn.cursor()
-        
-        # Create tables
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS images (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            file_hash TEXT UNIQUE NOT NULL,
-            file_name TEXT NOT NULL,
-            storage_path TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            file_size INTEGER NOT NULL,
-            is_deleted BOOLEAN DEFAULT 0
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT UNIQUE NOT NULL,
-            tag_type TEXT
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS image_tags (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            image_id INTEGER NOT NULL,
-            tag_id INTEGER NOT NULL,
-            FOREIGN KEY (image_id) REFERENCES images (id),
-            FOREIGN KEY (tag_id) REFERENCES tags (id)
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS annotations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            image_id INTEGER NOT NULL,
-            note TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (image_id) REFERENCES images (id)
-        )
-        ''')
-        
-        cursor.execute('''
-        CREATE TABLE IF NOT EXISTS audit_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            event_type TEXT NOT NULL,
-            status TEXT NOT NULL,
-            details TEXT
-        )
-        ''')
-        
-        conn.commit()
-        conn.close()
+        with closing(sqlite3.connect(str(file_path))) as conn:
+            # Same journal settings StorageInterface opens the vault with
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            
+            # Create all tables in one transaction
+            conn.executescript(STUB_SCHEMA_PATH.read_text())
 
 
 def main():
@@ -484,6 +529,10 @@ def main():
                         help='Create missing files and directories')
     parser.add_argument('--password', type=str, default='test123',
                         help='Password to test vault unlocking')
+    parser.add_argument('--stats', action='store_true',
+                        help='Report database row counts (scans every table)')
+    parser.add_argument('--serial', action='store_true',
+                        help='Run the file and database checks one after another')
     parser.add_argument('--verbose', '-v', action='store_true',
                         help='Enable verbose output')
     parser.add_argument('--debug', '-d', action='store_true',
@@ -508,7 +557,9 @@ def main():
     validator = VaultValidator(
         vault_path=vault_path,
         log=log,
-        create_missing=args.create_missing
+        create_missing=args.create_missing,
+        collect_stats=args.stats,
+        parallel=not args.serial
     )
     
     success = validator.run_all_checks(args.password)
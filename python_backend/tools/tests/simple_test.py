@@ -5,87 +5,45 @@ Simple test script to verify GraphiVault backend imports and basic functionality
 
 import sys
 import os
+from importlib import import_module
 from pathlib import Path
 
 # Add backend to path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
+# Backend modules checked by test_imports, in dependency order
+BACKEND_MODULES = (
+    'crypto_controller',
+    'vault_manager',
+    'image_processor',
+    'tag_manager',
+    'search_engine',
+    'audit_logger',
+    'session_manager',
+    'storage_interface',
+    'core_engine',
+    'ipc_gateway',
+)
+
 def test_imports():
     """Test that all modules can be imported"""
     print("Testing GraphiVault Backend Imports...")
     
-    try:
-        import crypto_controller
-        print("✓ crypto_controller imported")
-    except Exception as e:
-        print(f"✗ crypto_controller failed: {e}")
-        return False
-    
-    try:
-        import vault_manager
-        print("✓ vault_manager imported")
-    except Exception as e:
-        print(f"✗ vault_manager failed: {e}")
-        return False
-    
-    try:
-        import image_processor
-        print("✓ image_processor imported")
-    except Exception as e:
-        print(f"✗ image_processor failed: {e}")
-        return False
-    
-    try:
-        import tag_manager
-        print("✓ tag_manager imported")
-    except Exception as e:
-        print(f"✗ tag_manager failed: {e}")
-        return False
-    
-    try:
-        import search_engine
-        print("✓ search_engine imported")
-    except Exception as e:
-        print(f"✗ search_engine failed: {e}")
-        return False
-    
-    try:
-        import audit_logger
-        print("✓ audit_logger imported")
-    except Exception as e:
-        print(f"✗ audit_logger failed: {e}")
-        return False
-    
-    try:
-        import session_manager
-        print("✓ session_manager imported")
-    except Exception as e:
-        print(f"✗ session_manager failed: {e}")
-        return False
-    
-    try:
-        import storage_interface
-        print("✓ storage_interface imported")
-    except Exception as e:
-        print(f"✗ storage_interface failed: {e}")
-        return False
-    
-    try:
-        import core_engine
-        print("✓ core_engine imported")
-    except Exception as e:
-        print(f"✗ core_engine failed: {e}")
-        return False
-    
-    try:
-        import ipc_gateway
-        print("✓ ipc_gateway imported")
-    except Exception as e:
-        print(f"✗ ipc_gateway failed: {e}")
-        return False
-    
-    return True
+    # Collect the per-module lines and write them out in one go
+    lines = []
+    success = True
+    for module_name in BACKEND_MODULES:
+        try:
+            import_module(module_name)
+            lines.append(f"✓ {module_name} imported")
+        except Exception as e:
+            lines.append(f"✗ {module_name} failed: {e}")
+            success = False
+            break
+    
+    print("\n".join(lines))
+    return success
 
 def test_basic_functionality():
     """Test basic functionality"""
@@ -4,11 +4,15 @@ GraphiVault Backend Test Suite
 Comprehensive tests for the GraphiVault backend architecture
 """
 
+import io
 import os
 import sys
 import json
+import base64
 import tempfile
-import shutil
+import time
+import gc
+import statistics
 from pathlib import Path
 import unittest
 from datetime import datetime, timezone
@@ -45,23 +49,40 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Timed iterations per performance measurement
+PERF_RUNS = 20
+
+
 class TestGraphiVaultBackend(unittest.TestCase):
     """Test suite for GraphiVault backend"""
     
+    master_password = "test_password_123"
+    
+    @classmethod
+    def setUpClass(cls):
+        """Create one temp root, unlocked crypto controller and storage for the class"""
+        cls._temp_root = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._temp_root.cleanup)
+        
+        # Key derivation dominates setup time; tests that don't clear keys
+        # share this controller
+        cls.crypto = CryptoController({})
+        cls.crypto.initialize_master_key(cls.master_password)
+        cls.addClassCleanup(cls.crypto.clear_keys)
+        
+        # One storage (writer + reader pool) shared by the storage tests;
+        # registered after clear_keys so it closes first
+        cls.storage = StorageInterface(str(Path(cls._temp_root.name) / "shared.db"), cls.crypto)
+        cls.addClassCleanup(cls.storage.close)
+    
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = Path(tempfile.mkdtemp())
+        self.test_dir = Path(self._temp_root.name) / self._testMethodName
+        self.test_dir.mkdir()
         self.vault_path = self.test_dir / "test_vault"
-        self.master_password = "test_password_123"
         
         print(f"Test vault created at: {self.vault_path}")
     
-    def tearDown(self):
-        """Clean up test environment"""
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
-        print("Test vault cleaned up")
-    
     def test_crypto_controller(self):
         """Test crypto controller functionality"""
         print("\n=== Testing Crypto Controller ===")
@@ -97,10 +118,7 @@ class TestGraphiVaultBackend(unittest.TestCase):
         """Test vault manager functionality"""
         print("\n=== Testing Vault Manager ===")
         
-        crypto = CryptoController({})
-        crypto.initialize_master_key(self.master_password)
-        
-        vault_manager = VaultManager(self.vault_path, crypto)
+        vault_manager = VaultManager(self.vault_path, self.crypto)
         
         # Test vault creation
         self.assertTrue(vault_manager.create_vault())
@@ -127,10 +145,7 @@ class TestGraphiVaultBackend(unittest.TestCase):
         """Test tag manager functionality"""
         print("\n=== Testing Tag Manager ===")
         
-        crypto = CryptoController({})
-        crypto.initialize_master_key(self.master_password)
-        
-        tag_manager = TagManager(crypto)
+        tag_manager = TagManager(self.crypto)
         
         # Test tag encryption/decryption
         test_tags = ["vacation", "beach", "summer_2024"]
@@ -183,6 +198,14 @@ class TestGraphiVaultBackend(unittest.TestCase):
         ))
         print("✓ Search matching working")
         
+        # Test query compilation is parsed once and reused
+        compiled = search_engine.compile_query("vac* beach")
+        self.assertIs(compiled, search_engine.compile_query("vac* beach"))
+        self.assertEqual(len(compiled['wildcard_patterns']), 1)
+        # An invalid wildcard term matches nothing, as before compilation
+        self.assertFalse(search_engine.matches_query("vac* (beach*", "beach.jpg", ["beach"], {}))
+        print("✓ Query compilation working")
+        
         # Test search and ranking
         results = search_engine.search_and_rank("beach", test_records)
         self.assertTrue(len(results) > 0)
@@ -249,11 +272,7 @@ class TestGraphiVaultBackend(unittest.TestCase):
         """Test storage interface functionality"""
         print("\n=== Testing Storage Interface ===")
         
-        crypto = CryptoController({})
-        crypto.initialize_master_key(self.master_password)
-        
-        db_path = self.test_dir / "test.db"
-        storage = StorageInterface(str(db_path), crypto)
+        storage = self.storage
         
         # Test vault settings
         self.assertTrue(storage.set_vault_setting('test_key', 'test_value'))
@@ -276,8 +295,6 @@ class TestGraphiVaultBackend(unittest.TestCase):
         stats = storage.get_storage_stats()
         self.assertIn('total_images', stats)
         print("✓ Storage statistics working")
-        
-        storage.close()
     
     def test_core_engine_integration(self):
         """Test core engine integration"""
@@ -318,6 +335,49 @@ class TestGraphiVaultBackend(unittest.TestCase):
         lock_result = gateway.lock_vault()
         self.assertTrue(lock_result['success'])
         print("✓ IPC gateway vault locking working")
+    
+    def test_ipc_thumbnail_after_delete(self):
+        """Test that deleting an image removes its cached thumbnails"""
+        print("\n=== Testing IPC Thumbnail Cleanup ===")
+        
+        from PIL import Image
+        
+        gateway = IPCGateway(str(self.vault_path))
+        self.assertTrue(gateway.initialize_vault(self.master_password)['success'])
+        
+        buffer = io.BytesIO()
+        Image.new('RGB', (400, 300), (200, 10, 10)).save(buffer, 'JPEG')
+        add_result = gateway.add_image(base64.b64encode(buffer.getvalue()).decode('ascii'))
+        self.assertTrue(add_result['success'])
+        image_id = add_result['image_id']
+        
+        # Render two sizes so both land in the thumbnail cache
+        self.assertTrue(gateway.get_thumbnail(image_id, 200, 200)['success'])
+        self.assertTrue(gateway.get_thumbnail(image_id, 64, 64)['success'])
+        thumb_dir = self.vault_path / 'thumbnails'
+        self.assertEqual(len(list(thumb_dir.glob('*.webp.enc'))), 2)
+        
+        self.assertTrue(gateway.delete_image(image_id)['success'])
+        self.assertEqual(list(thumb_dir.glob('*.webp.enc')), [])
+        self.assertFalse(gateway.get_thumbnail(image_id, 200, 200)['success'])
+        print("✓ IPC gateway thumbnail cleanup on delete working")
+        
+        self.assertTrue(gateway.lock_vault()['success'])
+
+
+def _time_op(op, runs: int = PERF_RUNS) -> tuple:
+    """Median and stdev (seconds) of op() over runs, after one warm-up call"""
+    op()
+    samples = []
+    gc.disable()
+    try:
+        for _ in range(runs):
+            start = time.perf_counter_ns()
+            op()
+            samples.append((time.perf_counter_ns() - start) / 1e9)
+    finally:
+        gc.enable()
+    return statistics.median(samples), statistics.stdev(samples)
 
 
 def run_performance_tests():
@@ -326,8 +386,6 @@ def run_performance_tests():
     print("PERFORMANCE TESTS")
     print("="*50)
     
-    import time
-    
     # Test crypto performance
     print("\n--- Crypto Performance ---")
     crypto = CryptoController({})
@@ -335,17 +393,13 @@ def run_performance_tests():
     
     # Test data encryption speed
     test_data = b"X" * (1024 * 1024)  # 1MB of data
-    
-    start_time = time.time()
     encrypted = crypto.encrypt_data(test_data)
-    encrypt_time = time.time() - start_time
     
-    start_time = time.time()
-    decrypted = crypto.decrypt_data(encrypted)
-    decrypt_time = time.time() - start_time
+    encrypt_time, encrypt_dev = _time_op(lambda: crypto.encrypt_data(test_data))
+    decrypt_time, decrypt_dev = _time_op(lambda: crypto.decrypt_data(encrypted))
     
-    print(f"✓ 1MB encryption: {encrypt_time:.3f}s ({1/encrypt_time:.1f} MB/s)")
-    print(f"✓ 1MB decryption: {decrypt_time:.3f}s ({1/decrypt_time:.1f} MB/s)")
+    print(f"✓ 1MB encryption: {encrypt_time * 1000:.2f}ms ±{encrypt_dev * 1000:.2f} ({1/encrypt_time:.1f} MB/s)")
+    print(f"✓ 1MB decryption: {decrypt_time * 1000:.2f}ms ±{decrypt_dev * 1000:.2f} ({1/decrypt_time:.1f} MB/s)")
     
     crypto.clear_keys()
 
@@ -357,8 +411,13 @@ def main():
       # Check dependencies
     try:
         import PIL
-        from PIL import Image
+        from PIL import Image, features
         print("✓ PIL/Pillow available")
+        # Thumbnailing is decode-bound; stock libjpeg is several times slower
+        if features.check_feature('libjpeg_turbo'):
+            print("✓ Pillow built with libjpeg-turbo")
+        else:
+            print("✗ Pillow built without libjpeg-turbo - thumbnails will be slower")
     except ImportError:
         print("✗ PIL/Pillow not available - some tests may fail")
     
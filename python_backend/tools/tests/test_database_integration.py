@@ -6,6 +6,7 @@ Test the database initialization and basic operations
 
 import os
 import sys
+import sqlite3
 import tempfile
 import shutil
 from pathlib import Path
@@ -165,6 +166,97 @@ def test_database_operations():
     return True
 
 
+def _committed_meta(db_path: Path, key: str):
+    """Read a vault_meta value through a separate connection (committed data only)"""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        row = conn.execute("SELECT value FROM vault_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def test_bulk_transactions():
+    """Test bulk() commit, nesting and rollback behaviour"""
+    print("\n=== Testing Bulk Transactions ===")
+    
+    # Create temporary test directory
+    test_dir = Path(tempfile.mkdtemp())
+    vault_path = test_dir / "test_vault"
+    
+    try:
+        # Initialize vault
+        initializer = DatabaseInitializer(str(vault_path))
+        if not initializer.initialize_vault("test_password_123"):
+            print("✗ Failed to initialize vault for bulk test")
+            return False
+        
+        crypto = CryptoController({})
+        if not crypto.initialize_master_key("test_password_123"):
+            print("✗ Failed to initialize crypto controller")
+            return False
+        
+        db_path = vault_path / "data" / "graphivault.db"
+        storage = StorageInterface(str(db_path), crypto)
+        
+        # Writes inside the block are committed once, when it exits
+        with storage.bulk():
+            storage.set_vault_meta("bulk_key", "bulk_value")
+            if _committed_meta(db_path, "bulk_key") is not None:
+                print("✗ Bulk write visible before the block exited")
+                return False
+        
+        if _committed_meta(db_path, "bulk_key") == "bulk_value":
+            print("✓ Bulk block committed at exit")
+        else:
+            print("✗ Bulk block did not commit at exit")
+            return False
+        
+        # A nested block joins the outer transaction
+        with storage.bulk():
+            with storage.bulk():
+                storage.set_vault_meta("nested_key", "nested_value")
+            if _committed_meta(db_path, "nested_key") is not None:
+                print("✗ Nested bulk block committed on its own")
+                return False
+        
+        if _committed_meta(db_path, "nested_key") == "nested_value":
+            print("✓ Nested bulk block joined the outer transaction")
+        else:
+            print("✗ Nested bulk write was lost")
+            return False
+        
+        # An exception rolls the block back and drops the cached value
+        try:
+            with storage.bulk():
+                storage.set_vault_meta("rollback_key", "rollback_value")
+                raise RuntimeError("abort bulk block")
+        except RuntimeError:
+            pass
+        
+        if (storage.get_vault_meta("rollback_key") is None
+                and _committed_meta(db_path, "rollback_key") is None):
+            print("✓ Bulk block rolled back and cleared the meta cache")
+        else:
+            print("✗ Rolled back bulk write is still visible")
+            return False
+        
+        # Clean up
+        storage.close()
+        crypto.clear_keys()
+        
+    except Exception as e:
+        print(f"✗ Exception during bulk transaction test: {e}")
+        return False
+    finally:
+        # Cleanup
+        if test_dir.exists():
+            shutil.rmtree(test_dir)
+            print("✓ Bulk test cleanup completed")
+    
+    return True
+
+
 def main():
     """Run all database integration tests"""
     print("GraphiVault Database Integration Tests")
@@ -185,6 +277,9 @@ def main():
     if not test_database_operations():
         all_passed = False
     
+    if not test_bulk_transactions():
+        all_passed = False
+    
     # Summary
     print("\n" + "=" * 50)
     if all_passed:
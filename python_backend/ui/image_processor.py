@@ -5,6 +5,7 @@ Handles image validation, thumbnail generation, and metadata extraction
 Supports multiple formats with security-first processing
 """
 
+import io
 import os
 import mimetypes
 from pathlib import Path
@@ -18,6 +19,14 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+# libvips shrinks JPEGs in the DCT domain and streams the decode; use it
+# for on-demand thumbnails when installed
+try:
+    import pyvips
+    VIPS_AVAILABLE = True
+except ImportError:
+    VIPS_AVAILABLE = False
+
 
 class ImageProcessor:
     """
@@ -45,6 +54,13 @@ class ImageProcessor:
         
         if not PIL_AVAILABLE:
             raise RuntimeError("PIL/Pillow is required for image processing")
+        
+        # Pillow decoders for supported_formats, so opening skips the rest
+        extensions = Image.registered_extensions()
+        self.pil_formats = tuple({
+            extensions[f'.{ext}'] for ext in self.config['supported_formats']
+            if f'.{ext}' in extensions
+        })
     
     def validate_image(self, file_path: Path) -> bool:
         """
@@ -121,7 +137,10 @@ class ImageProcessor:
         try:
             thumbnail_size = size or self.config['thumbnail_size']
             
-            with Image.open(input_path) as img:
+            with Image.open(input_path, formats=self.pil_formats) as img:
+                # Let the JPEG decoder downscale in the DCT domain first
+                img.draft('RGB', thumbnail_size)
+                
                 # Convert to RGB if necessary (for PNG with transparency, etc.)
                 if img.mode in ('RGBA', 'LA', 'P'):
                     # Create white background for transparency
@@ -157,6 +176,29 @@ class ImageProcessor:
         except Exception:
             return False
     
+    def render_thumbnail(self, image_data: bytes, size: Tuple[int, int],
+                         quality: int = 80) -> bytes:
+        """
+        Render an in-memory image to a WebP thumbnail that fits within size
+        """
+        width, height = size
+        
+        if VIPS_AVAILABLE:
+            thumb = pyvips.Image.thumbnail_buffer(image_data, width, height=height)
+            return thumb.write_to_buffer(f'.webp[Q={quality}]')
+        
+        with Image.open(io.BytesIO(image_data)) as img:
+            # Let the JPEG decoder downscale in the DCT domain before resampling
+            img.draft('RGB', (width, height))
+            img = ImageOps.exif_transpose(img)
+            if img.mode not in ('RGB', 'RGBA', 'L'):
+                img = img.convert('RGBA' if 'A' in img.getbands() else 'RGB')
+            img.thumbnail((width, height), Image.Resampling.LANCZOS)
+            
+            buffer = io.BytesIO()
+            img.save(buffer, 'WEBP', quality=quality)
+            return buffer.getvalue()
+    
     def extract_metadata(self, file_path: Path) -> Dict[str, Any]:
         """
         Extract and sanitize image metadata
@@ -5,7 +5,14 @@ Manages encrypted tags and metadata with separate encryption domain
 Provides secure tagging system with privacy-first design
 """
 
+import re
 import json
+import time
+import heapq
+import bisect
+import hashlib
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Set, Any, Optional
 from datetime import datetime, timezone
 
@@ -14,6 +21,63 @@ try:
 except ImportError:
     from crypto.crypto_controller import CryptoController
 
+# Anything outside alphanumerics, hyphens, underscores and common separators;
+# stripped from tags in one C-level pass
+_DISALLOWED_TAG_CHARS = re.compile(r'[^a-z0-9_:/.-]')
+
+# (whole second, its ISO-8601 string) last produced by _now_iso
+_now_iso_cache = (None, '')
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time as an ISO-8601 string at one-second resolution,
+    formatted once per second however many tags are stamped in it
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _now_iso_cache
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second, timezone.utc).isoformat()
+        _now_iso_cache = (second, cached_iso)
+    return cached_iso
+
+
+def _ns_to_iso(ns: Optional[int]) -> Optional[str]:
+    """ISO-8601 string for a time.time_ns() stamp kept in the tag statistics"""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9, timezone.utc).isoformat()
+
+
+def _iso_to_ns(value: Any) -> Optional[int]:
+    """time.time_ns() stamp for an imported timestamp, ISO string or integer"""
+    if value is None or isinstance(value, int):
+        return value
+    return int(datetime.fromisoformat(value).timestamp() * 1_000_000) * 1000
+
+
+# orjson serializes straight to UTF-8 bytes and parses bytes without a decode
+# step; the stdlib fallback reads and writes the same JSON
+try:
+    import orjson
+    
+    def _dump_tag_data(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    
+    def _dump_export(data: Dict[str, Any]) -> str:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    _load_json = orjson.loads
+except ImportError:
+    def _dump_tag_data(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, sort_keys=True).encode('utf-8')
+    
+    def _dump_export(data: Dict[str, Any]) -> str:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    
+    _load_json = json.loads
+
 
 class TagManager:
     """
@@ -27,32 +91,45 @@ class TagManager:
     - Tag analytics and usage statistics
     """
     
+    # Most decrypted tag payloads kept in _tag_cache
+    TAG_CACHE_SIZE = 1024
+    
     def __init__(self, crypto_controller: CryptoController):
         """Initialize tag manager"""
         self.crypto = crypto_controller
-        self._tag_cache = {}  # In-memory cache for performance
+        # Decrypted tags by ciphertext digest, least recently used first
+        self._tag_cache = OrderedDict()
         self._tag_stats = {}  # Tag usage statistics
+        # (lowercased tag, tag) for every tag in _tag_stats, kept sorted for
+        # prefix lookups in suggest_tags
+        self._tags_sorted = []
+        # Per-thread payload dict reused by encrypt_tags
+        self._tls = threading.local()
     
     def encrypt_tags(self, tags: List[str]) -> bytes:
         """
         Encrypt a list of tags using the tag keychain
         """
         try:
-            # Prepare tag data
-            tag_data = {
-                'tags': self._normalize_tags(tags),
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'version': '1.0'
-            }
+            normalized_tags = self._normalize_tags(tags)
+            
+            # Prepare tag data in this thread's scratch dict; the serializer
+            # keeps no reference to it, so it is refilled on the next call
+            tag_data = getattr(self._tls, 'tag_data', None)
+            if tag_data is None:
+                tag_data = self._tls.tag_data = {}
+            tag_data['tags'] = normalized_tags
+            tag_data['created_at'] = _now_iso()
+            tag_data['version'] = '1.0'
             
             # Convert to JSON bytes
-            tag_json = json.dumps(tag_data, sort_keys=True).encode('utf-8')
+            tag_json = _dump_tag_data(tag_data)
             
             # Encrypt using tag keychain
             encrypted_tags = self.crypto.encrypt_with_tag_keychain(tag_json)
             
             # Update tag statistics
-            self._update_tag_stats(tags)
+            self._update_tag_stats(normalized_tags, already_normalized=True)
             
             return encrypted_tags
             
@@ -64,14 +141,26 @@ class TagManager:
         Decrypt tags using the tag keychain
         """
         try:
+            # A ciphertext always decrypts to the same tags, so repeat reads
+            # skip the crypto and the parse
+            cache_key = hashlib.blake2b(encrypted_tags, digest_size=16).digest()
+            cached = self._tag_cache.get(cache_key)
+            if cached is not None:
+                self._tag_cache.move_to_end(cache_key)
+                return list(cached)
+            
             # Decrypt tag data
             decrypted_data = self.crypto.decrypt_with_tag_keychain(encrypted_tags)
             
             # Parse JSON
-            tag_data = json.loads(decrypted_data.decode('utf-8'))
+            tag_data = _load_json(decrypted_data)
             
             # Extract tags
-            return tag_data.get('tags', [])
+            tags = tag_data.get('tags', [])
+            self._tag_cache[cache_key] = tuple(tags)
+            if len(self._tag_cache) > self.TAG_CACHE_SIZE:
+                self._tag_cache.popitem(last=False)
+            return tags
             
         except Exception as e:
             raise RuntimeError(f"Tag decryption failed: {e}")
@@ -80,39 +169,62 @@ class TagManager:
         """
         Add a new tag to existing encrypted tags
         """
+        try:
+            return self.add_tags_batch(existing_encrypted_tags, [new_tag])
+            
+        except Exception as e:
+            raise RuntimeError(f"Failed to add tag: {e}")
+    
+    def remove_tag(self, existing_encrypted_tags: bytes, tag_to_remove: str) -> bytes:
+        """
+        Remove a tag from existing encrypted tags
+        """
+        try:
+            return self.remove_tags_batch(existing_encrypted_tags, [tag_to_remove])
+            
+        except Exception as e:
+            raise RuntimeError(f"Failed to remove tag: {e}")
+    
+    def add_tags_batch(self, existing_encrypted_tags: bytes, new_tags: List[str]) -> bytes:
+        """
+        Add several tags with one decrypt and one encrypt
+        """
         try:
             # Decrypt existing tags
-            existing_tags = self.decrypt_tags(existing_encrypted_tags)
+            existing_tags = set(self.decrypt_tags(existing_encrypted_tags))
             
-            # Add new tag (avoid duplicates)
-            normalized_tag = self._normalize_tag(new_tag)
-            if normalized_tag not in existing_tags:
-                existing_tags.append(normalized_tag)
+            # Add new tags (the set drops duplicates); if all are already
+            # there, the existing ciphertext is still current
+            added = {self._normalize_tag(tag) for tag in new_tags} - existing_tags
+            added.discard('')
+            if not added:
+                return existing_encrypted_tags
             
             # Re-encrypt and return
-            return self.encrypt_tags(existing_tags)
+            return self.encrypt_tags(list(existing_tags | added))
             
         except Exception as e:
-            raise RuntimeError(f"Failed to add tag: {e}")
+            raise RuntimeError(f"Failed to add tags: {e}")
     
-    def remove_tag(self, existing_encrypted_tags: bytes, tag_to_remove: str) -> bytes:
+    def remove_tags_batch(self, existing_encrypted_tags: bytes, tags_to_remove: List[str]) -> bytes:
         """
-        Remove a tag from existing encrypted tags
+        Remove several tags with one decrypt and one encrypt
         """
         try:
             # Decrypt existing tags
-            existing_tags = self.decrypt_tags(existing_encrypted_tags)
+            existing_tags = set(self.decrypt_tags(existing_encrypted_tags))
             
-            # Remove tag
-            normalized_tag = self._normalize_tag(tag_to_remove)
-            if normalized_tag in existing_tags:
-                existing_tags.remove(normalized_tag)
+            # Remove tags; if none are present, the existing ciphertext is
+            # still current
+            removed = existing_tags.intersection(self._normalize_tag(tag) for tag in tags_to_remove)
+            if not removed:
+                return existing_encrypted_tags
             
             # Re-encrypt and return
-            return self.encrypt_tags(existing_tags)
+            return self.encrypt_tags(list(existing_tags - removed))
             
         except Exception as e:
-            raise RuntimeError(f"Failed to remove tag: {e}")
+            raise RuntimeError(f"Failed to remove tags: {e}")
     
     def update_tags(self, existing_encrypted_tags: bytes, new_tags: List[str]) -> bytes:
         """
@@ -129,26 +241,26 @@ class TagManager:
         Create hierarchical structure from flat tags
         Supports syntax like "category:subcategory" or "category/subcategory"
         """
+        # Subcategories collect as dict keys: an insertion-ordered set
         hierarchy = {}
         
         try:
             for tag in tags:
-                # Check for hierarchy separators
-                if ':' in tag:
-                    parts = tag.split(':', 1)
-                    category, subcategory = parts[0].strip(), parts[1].strip()
-                elif '/' in tag:
-                    parts = tag.split('/', 1)
-                    category, subcategory = parts[0].strip(), parts[1].strip()
+                # Check for hierarchy separators; partition finds and
+                # splits in one pass without building a list
+                head, sep, tail = tag.partition(':')
+                if not sep:
+                    head, sep, tail = tag.partition('/')
+                
+                if sep:
+                    category, subcategory = head.strip(), tail.strip()
                 else:
                     # Flat tag
                     category, subcategory = 'general', tag.strip()
                 
-                if category not in hierarchy:
-                    hierarchy[category] = []
-                
-                if subcategory not in hierarchy[category]:
-                    hierarchy[category].append(subcategory)
+                hierarchy.setdefault(category, {})[subcategory] = None
+            
+            hierarchy = {category: list(subcategories) for category, subcategories in hierarchy.items()}
             
         except Exception:
             # Return flat structure on error
@@ -165,31 +277,32 @@ class TagManager:
         try:
             partial_lower = partial_tag.lower().strip()
             
+            def usage(tag):
+                return self._tag_stats[tag].get('count', 0)
+            
             if not partial_lower:
                 # Return most popular tags
-                sorted_tags = sorted(
-                    self._tag_stats.items(),
-                    key=lambda x: x[1].get('count', 0),
-                    reverse=True
-                )
-                return [tag for tag, _ in sorted_tags[:limit]]
-            
-            # Find matching tags
-            matches = []
-            for tag, stats in self._tag_stats.items():
-                tag_lower = tag.lower()
-                
-                # Exact prefix match gets highest priority
-                if tag_lower.startswith(partial_lower):
-                    matches.append((tag, stats.get('count', 0), 0))
-                # Contains match gets lower priority
-                elif partial_lower in tag_lower:
-                    matches.append((tag, stats.get('count', 0), 1))
+                return heapq.nlargest(limit, self._tag_stats, key=usage)
+            
+            # Exact prefix matches get highest priority; they sit together
+            # in the sorted index starting at the bisection point
+            tags_sorted = self._tags_sorted
+            prefix_matches = []
+            i = bisect.bisect_left(tags_sorted, (partial_lower, ''))
+            while i < len(tags_sorted) and tags_sorted[i][0].startswith(partial_lower):
+                prefix_matches.append(tags_sorted[i][1])
+                i += 1
             
-            # Sort by priority, then by usage count
-            matches.sort(key=lambda x: (x[2], -x[1]))
+            # Sort by usage count
+            suggestions = heapq.nlargest(limit, prefix_matches, key=usage)
             
-            suggestions = [tag for tag, _, _ in matches[:limit]]
+            # Contains matches get lower priority, only needed to fill up
+            if len(suggestions) < limit:
+                contains_matches = [
+                    tag for tag_lower, tag in tags_sorted
+                    if partial_lower in tag_lower and not tag_lower.startswith(partial_lower)
+                ]
+                suggestions += heapq.nlargest(limit - len(suggestions), contains_matches, key=usage)
             
         except Exception:
             pass
@@ -204,26 +317,27 @@ class TagManager:
             total_tags = len(self._tag_stats)
             total_usage = sum(stats.get('count', 0) for stats in self._tag_stats.values())
             
-            # Most popular tags
-            popular_tags = sorted(
+            # Most popular tags; nlargest keeps a 10-entry heap rather than
+            # sorting every tag, with the same result as sorted()[:10]
+            popular_tags = heapq.nlargest(
+                10,
                 self._tag_stats.items(),
-                key=lambda x: x[1].get('count', 0),
-                reverse=True
-            )[:10]
+                key=lambda x: x[1].get('count', 0)
+            )
             
             # Recent tags
-            recent_tags = sorted(
+            recent_tags = heapq.nlargest(
+                10,
                 self._tag_stats.items(),
-                key=lambda x: x[1].get('last_used', ''),
-                reverse=True
-            )[:10]
+                key=lambda x: x[1].get('last_used') or 0
+            )
             
             return {
                 'total_unique_tags': total_tags,
                 'total_tag_usage': total_usage,
                 'most_popular': [{'tag': tag, 'count': stats.get('count', 0)} 
                                for tag, stats in popular_tags],
-                'recently_used': [{'tag': tag, 'last_used': stats.get('last_used')} 
+                'recently_used': [{'tag': tag, 'last_used': _ns_to_iso(stats.get('last_used'))} 
                                 for tag, stats in recent_tags],
                 'average_tags_per_image': total_usage / max(1, total_tags)
             }
@@ -266,16 +380,23 @@ class TagManager:
         try:
             export_data = {
                 'format': format,
-                'exported_at': datetime.now(timezone.utc).isoformat(),
+                'exported_at': _now_iso(),
                 'version': '1.0',            'statistics': self.get_tag_statistics(),
-                'tag_data': self._tag_stats
+                'tag_data': {
+                    tag: {
+                        **stats,
+                        'first_used': _ns_to_iso(stats.get('first_used')),
+                        'last_used': _ns_to_iso(stats.get('last_used'))
+                    }
+                    for tag, stats in self._tag_stats.items()
+                }
             }
             
             if format.lower() == 'json':
-                return json.dumps(export_data, indent=2, ensure_ascii=False)
+                return _dump_export(export_data)
             else:
                 # Could support other formats like CSV, XML
-                return json.dumps(export_data, indent=2, ensure_ascii=False)
+                return _dump_export(export_data)
                 
         except Exception:
             return '{}'
@@ -286,7 +407,7 @@ class TagManager:
         """
         try:
             if format.lower() == 'json':
-                data = json.loads(import_data)
+                data = _load_json(import_data)
                 
                 if 'tag_data' in data:
                     # Merge with existing statistics
@@ -297,7 +418,15 @@ class TagManager:
                             imported_count = stats.get('count', 0)
                             self._tag_stats[tag]['count'] = existing_count + imported_count
                         else:
-                            self._tag_stats[tag] = stats
+                            # Exports carry ISO strings; stats keep integers,
+                            # and a missing timestamp stays missing
+                            imported = dict(stats)
+                            for field in ('first_used', 'last_used'):
+                                value = _iso_to_ns(imported.pop(field, None))
+                                if value is not None:
+                                    imported[field] = value
+                            self._tag_stats[tag] = imported
+                            self._index_tag(tag)
                 
                 return True
             
@@ -318,8 +447,7 @@ class TagManager:
         
         # Remove special characters that might cause issues
         # Keep alphanumeric, hyphens, underscores, and common separators
-        allowed_chars = 'abcdefghijklmnopqrstuvwxyz0123456789-_:/.'
-        normalized = ''.join(c for c in normalized if c in allowed_chars)
+        normalized = _DISALLOWED_TAG_CHARS.sub('', normalized)
         
         # Remove leading/trailing separators
         normalized = normalized.strip('-_:/')
@@ -330,29 +458,35 @@ class TagManager:
         """
         Normalize a list of tags
         """
-        normalized = []
-        
-        for tag in tags:
-            norm_tag = self._normalize_tag(tag)
-            if norm_tag and norm_tag not in normalized:
-                normalized.append(norm_tag)
+        normalized = {self._normalize_tag(tag) for tag in tags}
+        normalized.discard('')
         
         return sorted(normalized)  # Sort for consistency
     
-    def _update_tag_stats(self, tags: List[str]) -> None:
+    def _update_tag_stats(self, tags: List[str], already_normalized: bool = False) -> None:
         """
-        Update tag usage statistics
+        Update tag usage statistics; already_normalized marks output of
+        _normalize_tags, which is used as is
         """
         try:
-            current_time = datetime.now(timezone.utc).isoformat()
+            # Integer nanoseconds: no formatting per update, and they
+            # compare numerically when ranking recent tags
+            current_time = time.time_ns()
             
-            for tag in self._normalize_tags(tags):
+            if not already_normalized:
+                # Stats are keyed by tag, so skip the sort _normalize_tags
+                # does; dict keys drop repeats and keep first-seen order
+                tags = dict.fromkeys(self._normalize_tag(tag) for tag in tags)
+                tags.pop('', None)
+            
+            for tag in tags:
                 if tag not in self._tag_stats:
                     self._tag_stats[tag] = {
                         'count': 0,
                         'first_used': current_time,
                         'last_used': current_time
                     }
+                    self._index_tag(tag)
                 
                 self._tag_stats[tag]['count'] += 1
                 self._tag_stats[tag]['last_used'] = current_time
@@ -371,3 +505,10 @@ class TagManager:
         Clear tag usage statistics
         """
         self._tag_stats.clear()
+        self._tags_sorted.clear()
+    
+    def _index_tag(self, tag: str) -> None:
+        """
+        Add a newly seen tag to the sorted suggestion index
+        """
+        bisect.insort(self._tags_sorted, (tag.lower(), tag))